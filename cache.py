@@ -0,0 +1,299 @@
+"""
+Caching helpers for the Content Creator Agent
+Research results are expensive (multi-second agent runs), so they are kept on disk across sessions
+and, optionally, matched by meaning so rephrased topics hit too
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class DiskCache:
+    """Persistent key/value cache backed by SQLite, with an expiry stored per entry"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a live entry
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            The cached value, or default
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            if row[1] <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a JSON-serializable value
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires
+        """
+        payload = json.dumps(value, default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries that were never read again
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+class TTLCache:
+    """
+    In-process cache with a per-entry expiry and LRU eviction past max_size.
+    An entry can outlive its TTL by a stale window, during which callers may
+    serve it while a refresh runs (stale-while-revalidate).
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, float]]" = OrderedDict()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up an entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, fresh) while the entry is within its TTL or stale window, else None
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            fresh = entry[1] > now
+            self.stats["hits" if fresh else "stale_hits"] += 1
+            return entry[0], fresh
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0) -> None:
+        """
+        Store a value, evicting the least recently used entries past max_size
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the entry is fresh
+            stale_ttl: Further seconds it may be served stale while being refreshed
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache over topic embeddings, so rephrased topics reuse earlier research.
+    Requires sentence-transformers and faiss; both are imported on construction.
+    Adds are written to disk at most once per flush_interval (and at exit); each write
+    first drops expired entries, so the index only holds live research.
+    """
+
+    def __init__(self, path: str, model: str = "all-MiniLM-L6-v2", threshold: float = 0.92,
+                 flush_interval: float = 30.0):
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._faiss = faiss
+        self._model = SentenceTransformer(model)
+        self.threshold = threshold
+        self.flush_interval = flush_interval
+        self._index_path = f"{path}.faiss"
+        self._entries_path = f"{path}.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Inner product over normalized vectors is cosine similarity
+        self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+        self._entries = []
+        # Row i of the index belongs to self._entries[i]
+        if os.path.exists(self._index_path) and os.path.exists(self._entries_path):
+            index = faiss.read_index(self._index_path)
+            with open(self._entries_path, "r") as f:
+                entries = json.load(f)
+            # A crash between the two writes leaves them out of step; start empty rather than mismatch rows
+            if index.ntotal == len(entries) and index.d == self._index.d:
+                self._index, self._entries = index, entries
+                with self._lock:
+                    self._dirty = self._prune()
+        atexit.register(self.flush)
+
+    def _embed(self, text: str):
+        return self._model.encode([text.strip().lower()], normalize_embeddings=True).astype("float32")
+
+    def _prune(self) -> bool:
+        """Rebuild the index without expired entries; caller holds the lock. Returns whether any were dropped"""
+        now = time.time()
+        live = [row for row, entry in enumerate(self._entries) if entry["expires_at"] > now]
+        if len(live) == len(self._entries):
+            return False
+        vectors = self._index.reconstruct_n(0, self._index.ntotal)
+        index = self._faiss.IndexFlatIP(self._index.d)
+        if live:
+            index.add(vectors[live])
+        self._index = index
+        self._entries = [self._entries[row] for row in live]
+        return True
+
+    def _write(self) -> None:
+        """Prune and persist the index and entries; caller holds the lock"""
+        self._prune()
+        self._faiss.write_index(self._index, self._index_path)
+        with open(self._entries_path, "w") as f:
+            json.dump(self._entries, f, default=str)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Write pending adds to disk now"""
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def get(self, scope: str, text: str) -> Any:
+        """
+        Find the closest live entry in the same scope
+
+        Args:
+            scope: Only entries stored under this scope can match (e.g. research type + platform focus)
+            text: Topic text to match
+
+        Returns:
+            The cached value, or None when nothing is similar enough
+        """
+        vector = self._embed(text)
+        with self._lock:
+            if not self._entries:
+                return None
+            scores, rows = self._index.search(vector, min(8, len(self._entries)))
+            now = time.time()
+            for score, row in zip(scores[0], rows[0]):
+                if score < self.threshold:
+                    break
+                entry = self._entries[row]
+                if entry["scope"] == scope and entry["expires_at"] > now:
+                    return entry["value"]
+        return None
+
+    def add(self, scope: str, text: str, value: Any, ttl: float) -> None:
+        """
+        Store a JSON-serializable value under the embedding of text
+
+        Args:
+            scope: Scope the entry can be matched in
+            text: Topic text to embed
+            value: Value to store
+            ttl: Seconds until the entry expires
+        """
+        vector = self._embed(text)
+        with self._lock:
+            self._index.add(vector)
+            self._entries.append({"scope": scope, "value": value, "expires_at": time.time() + ttl})
+            self._dirty = True
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self._write()
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key: the first caller runs the work, the rest wait for its result"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless a call with the same key is already running
+
+        Args:
+            key: Identifies equivalent calls
+            fn: Work to run
+
+        Returns:
+            The result of fn, shared with every caller that arrived while it ran
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -3,6 +3,13 @@ Configuration file for Reddit Agent and Content Creator Agent
 Easily customize prompts, model settings, and behavior
 """
 
+import functools
+import os
+import string
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+
 # =============================================================================
 # 1. REDDIT AGENT CONFIGURATION
 # =============================================================================
@@ -14,6 +21,8 @@ REDDIT_AGENT_CONFIG = {
         "temperature": 0.4,
         "max_tokens": None,  # None for default
         "top_p": None,  # None for default
+        "cached_content": None,  # Gemini context cache name (e.g. "cachedContents/abc123") holding the system prompt + tools
+        "prewarm_connection": True,  # Open the Gemini connection in the background at startup
     },
     
     # --- System Prompt ---
@@ -32,6 +41,25 @@ You are a Senior Research Analyst. Your goal is to provide unbiased, up-to-date
 # CORE DIRECTIVE
 Always use your tools; never use your internal knowledge. Ground all findings in retrieved data. If a search fails, try again differently before concluding.""",
     
+    # --- Fast Path (greetings / small talk, no tools) ---
+    "fast_path_model": "gemini-2.5-flash-lite",
+    "fast_path_system_prompt": "You are a helpful research assistant. Reply briefly and conversationally.",
+    
+    # --- Conversation Memory ---
+    "context_window_k": 10,  # Number of recent user/assistant turns resent each call
+    "summarization": {
+        "enabled": False,  # Summarize turns evicted from the window instead of dropping them
+        "batch_size": 4,  # Evicted messages to accumulate before each summary update
+        "max_tokens": 200,  # Target length of the rolling summary
+    },
+    
+    # --- Response Cache (exact repeats of a message in the same context) ---
+    "response_cache": {
+        "enabled": True,
+        "maxsize": 256,
+        "ttl": 300,  # Seconds; keeps answers reasonably fresh
+    },
+    
     # --- Tool-specific Settings ---
     "search_limits": {
         "subreddit_search_limit": 8,
@@ -41,7 +69,7 @@ Always use your tools; never use your internal knowledge. Ground all findings in
     # --- Logging Settings ---
     "logging": {
         "enabled": True,
-        "log_file": "reddit_agent_logs.json",
+        "log_file": "reddit_agent_logs.jsonl",
         "log_level": "INFO"
     }
 }
@@ -196,6 +224,37 @@ Write a complete, polished article based on the following details:
 - **Hashtags**: Use 1-3 relevant hashtags at the end of the final post only.
 - **Output**: Return the entire thread as a single string, with each post separated by \"---\".""",
 
+        # --- Content Bundle Tool (article + X thread + analysis in one call) ---
+        "content_bundle_prompt": """# TASK
+Using one shared research summary, produce three deliverables in a single response: a publication-ready article, an X thread, and a critique of the article.
+
+- **Topic**: {topic}
+- **Tone**: {tone_description}
+- **Style Guidelines**: {style}
+- **Current Date**: {current_date}
+
+# RESEARCH SUMMARY
+{research_summary}
+
+# DELIVERABLE 1: ARTICLE ({optimal_length})
+- Based on the Research Summary and ready for publication, not a brief or outline.
+- Include a compelling title, an engaging introduction, a well-organized body with clear headings and subheadings, and a concise conclusion.
+- Informative, valuable, and SEO-friendly.
+
+# DELIVERABLE 2: X THREAD ({thread_length} posts)
+- Based on the Research Summary; a platform-native thread, not a summary of the article.
+- Each post under 280 characters, numbered (1/N); the first post is a strong hook.
+- 1-3 relevant hashtags at the end of the final post only. Separate posts with \"---\".
+
+# DELIVERABLE 3: ANALYSIS OF THE ARTICLE
+Act as a brutally honest content critic. Start with a one-word verdict, **POST** or **TRASH**, then one paragraph explaining it. If **TRASH**, give a single high-impact fix.
+
+# OUTPUT FORMAT
+Output exactly these three marker lines, each followed by its deliverable, and nothing else:
+=== ARTICLE ===
+=== X THREAD ===
+=== ANALYSIS ===""",
+
         # --- Content Analysis Tool ---
         "content_analysis_prompt": """# ROLE & GOAL
 You are the final quality check, a brutally honest content critic. Your sole purpose is to determine if a piece of content is worth publishing or if it's a waste of time. Do not be sycophantic. Be direct, critical, and provide clear, actionable feedback.
@@ -285,14 +344,44 @@ You are the final quality check, a brutally honest content critic. Your sole pur
         "horror": "Evoke fear, dread, and unease. Use vivid, eerie descriptions, unsettling imagery, and a darker, slower pacing. The language should be chilling, immersive, and provoke a visceral reaction, leaving the audience disturbed or spooked."
     },
     
+    # --- Speculative Prefetch (interactive mode) ---
+    "prefetch_trending": {
+        "enabled": False,  # Refresh the trending report in the background while the menu is shown; spends API quota speculatively
+        "category": "general",
+        "min_interval": 300,  # Seconds between prefetches, to protect API quota
+    },
+    
+    # --- Conversation Memory ---
+    "memory_window": 20,  # Messages (e.g. research summaries) kept across create_content calls
+    
+    # --- Research Cache (persisted across sessions) ---
+    "caching": {
+        "enabled": True,
+        "path": os.path.join("cache", "research_cache.sqlite3"),
+        "generated_content": True,  # Also reuse generated scripts for repeat (topic, platform, type, tone)
+        "ttl_rules": {  # Seconds research stays fresh, by content type; "default" covers the rest
+            "trending": 600,  # Trending reports go stale within minutes
+            "news": 1800,  # Also the cap for topics mentioning today/latest/a year
+            "educational": 86400,
+            "how-to": 86400,
+            "default": 3600,
+        },
+        "semantic": {
+            "enabled": False,  # Match rephrased topics; needs sentence-transformers and faiss-cpu
+            "model": "all-MiniLM-L6-v2",
+            "threshold": 0.92,  # Minimum cosine similarity to reuse cached research
+            "path": os.path.join("cache", "semantic_research"),
+        },
+    },
+    
     # --- Logging Settings ---
     "logging": {
         "enabled": True,
-        "log_file": "content_creator_logs.json", 
+        "log_file": "content_creator_logs.jsonl", 
         "log_level": "INFO",
         "log_errors": False,  # Set to False to not log errors in main logging
         "separate_error_log": True,  # Log errors separately
-        "error_log_file": "content_creator_errors.json"
+        "error_log_file": "content_creator_errors.jsonl"
     }
 }
 
@@ -318,7 +407,15 @@ SHARED_CONFIG = {
     
     "rate_limits": {
         "reddit_requests_per_minute": 60,
-        "google_requests_per_minute": 100
+        "reddit_max_wait": 10,  # Seconds a Reddit tool may block on rate limits before raising RateLimitDeferred; None always waits
+        "google_requests_per_minute": 100,
+        "tool_concurrency_limit": 4  # Max tool calls executed in parallel per agent turn
+    },
+    
+    # Search tool results (Reddit, Google grounding) also kept on disk, so short-lived runs start warm
+    "tool_cache": {
+        "persistent": True,
+        "path": os.path.join("cache", "tool_cache.sqlite3"),
     }
 }
 
@@ -327,17 +424,31 @@ SHARED_CONFIG = {
 # Functions to access and manage the configuration dictionaries.
 # =============================================================================
 
+# Prompts are interned once so equal strings (e.g. preset bases) share storage
+REDDIT_AGENT_CONFIG["system_prompt"] = sys.intern(REDDIT_AGENT_CONFIG["system_prompt"])
+CONTENT_CREATOR_CONFIG["system_prompt"] = sys.intern(CONTENT_CREATOR_CONFIG["system_prompt"])
+for _name, _prompt in CONTENT_CREATOR_CONFIG["tool_prompts"].items():
+    CONTENT_CREATOR_CONFIG["tool_prompts"][_name] = sys.intern(_prompt)
+
+# Live views handed to agents and tools, so they always reflect update_config/apply_preset
+# without copying. MappingProxyType is shallow: it blocks replacing a top-level section,
+# but nested dicts (e.g. view["model"]) are the shared originals. Change settings only
+# through update_config/apply_preset.
+_REDDIT_AGENT_VIEW = MappingProxyType(REDDIT_AGENT_CONFIG)
+_CONTENT_CREATOR_VIEW = MappingProxyType(CONTENT_CREATOR_CONFIG)
+_SHARED_VIEW = MappingProxyType(SHARED_CONFIG)
+
 def get_reddit_agent_config():
-    """Get Reddit Agent configuration"""
-    return REDDIT_AGENT_CONFIG
+    """Get Reddit Agent configuration (live view; top-level keys cannot be reassigned, nested dicts are shared)"""
+    return _REDDIT_AGENT_VIEW
 
 def get_content_creator_config():
-    """Get Content Creator Agent configuration"""
-    return CONTENT_CREATOR_CONFIG
+    """Get Content Creator Agent configuration (live view; top-level keys cannot be reassigned, nested dicts are shared)"""
+    return _CONTENT_CREATOR_VIEW
 
 def get_shared_config():
-    """Get shared configuration"""
-    return SHARED_CONFIG
+    """Get shared configuration (live view; top-level keys cannot be reassigned, nested dicts are shared)"""
+    return _SHARED_VIEW
 
 def get_tool_prompt(prompt_name: str, **kwargs) -> str:
     """
@@ -357,19 +468,119 @@ def get_tool_prompt(prompt_name: str, **kwargs) -> str:
     
     prompt_template = config["tool_prompts"][prompt_name]
     
+    missing = _compile_prompt(prompt_template).fields.difference(kwargs)
+    if missing:
+        raise ValueError(f"Missing required variable '{min(missing)}' for prompt '{prompt_name}'")
+
+    # Only the parsed template is cached; rendered prompts embed one-off values like research summaries
+    formatted_prompt = _compile_prompt(prompt_template).render(kwargs)
+    _debug_prompt(prompt_name, formatted_prompt)
+    return formatted_prompt
+
+def get_specialized_prompt(prompt_name: str, **fixed) -> "CompiledPrompt":
+    """
+    Get a tool prompt with some variables already filled in
+    
+    Used for the variables drawn from small fixed sets (platform, content type, tone),
+    so each combination is specialized once and later calls only splice in the rest.
+    
+    Args:
+        prompt_name: Name of the prompt in tool_prompts
+        **fixed: Variables to fill in now
+        
+    Returns:
+        CompiledPrompt whose fields are the remaining variables
+    """
+    config = get_content_creator_config()
+    
+    if prompt_name not in config["tool_prompts"]:
+        raise ValueError(f"Prompt '{prompt_name}' not found in tool_prompts")
+    
+    prompt_template = config["tool_prompts"][prompt_name]
     try:
-        formatted_prompt = prompt_template.format(**kwargs)
+        return _specialize_prompt(prompt_template, tuple(sorted(fixed.items())))
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot key the cache; specialize uncached
+        return _compile_prompt(prompt_template).partial(fixed)
 
-        # --- ADD THESE LINES FOR DEBUGGING ---
-        print(f"\\n--- DEBUG: Final Prompt for {prompt_name} ---\\n")
-        print(formatted_prompt)
-        print(f"\\n--- END DEBUG: {prompt_name} ---\\n")
-                # -------------------------------------
+def render_prompt(prompt_name: str, prompt: "CompiledPrompt", **kwargs) -> str:
+    """
+    Render a specialized prompt from get_specialized_prompt
+    
+    Args:
+        prompt_name: Name of the prompt (for debug output and errors)
+        prompt: The specialized prompt
+        **kwargs: Values for its remaining variables
+        
+    Returns:
+        Formatted prompt string
+    """
+    missing = prompt.fields.difference(kwargs)
+    if missing:
+        raise ValueError(f"Missing required variable '{min(missing)}' for prompt '{prompt_name}'")
     
-        return formatted_prompt
-    except KeyError as e:
-        raise ValueError(f"Missing required variable {e} for prompt '{prompt_name}'")
+    formatted_prompt = prompt.render(kwargs)
+    _debug_prompt(prompt_name, formatted_prompt)
+    return formatted_prompt
 
+def _debug_prompt(prompt_name: str, formatted_prompt: str):
+    if os.getenv("PROMPT_DEBUG"):
+        print(f"\n--- DEBUG: Final Prompt for {prompt_name} ---\n")
+        print(formatted_prompt)
+        print(f"\n--- END DEBUG: {prompt_name} ---\n")
+
+def _convert_field(value, conversion, format_spec) -> str:
+    """Apply a replacement field's !conversion and :format_spec the way str.format does"""
+    if conversion == "r":
+        value = repr(value)
+    elif conversion == "a":
+        value = ascii(value)
+    return format(value, format_spec) if format_spec else str(value)
+
+class CompiledPrompt(NamedTuple):
+    """A prompt template pre-split into (literal, field, conversion, format_spec) parts"""
+    parts: tuple
+    fields: frozenset
+
+    def render(self, values: dict) -> str:
+        """Splice values into the template without re-parsing it"""
+        out = []
+        for literal, field, conversion, format_spec in self.parts:
+            out.append(literal)
+            if field is not None:
+                out.append(_convert_field(values[field], conversion, format_spec))
+        return "".join(out)
+
+    def partial(self, values: dict) -> "CompiledPrompt":
+        """Fill in the given fields now, folding them into the literals; the rest stay fields"""
+        parts = []
+        pending = ""
+        for literal, field, conversion, format_spec in self.parts:
+            pending += literal
+            if field is None:
+                continue
+            if field in values:
+                pending += _convert_field(values[field], conversion, format_spec)
+            else:
+                parts.append((pending, field, conversion, format_spec))
+                pending = ""
+        if pending:
+            parts.append((pending, None, None, None))
+        return CompiledPrompt(tuple(parts), frozenset(p[1] for p in parts if p[1] is not None))
+
+@functools.lru_cache(maxsize=64)
+def _compile_prompt(prompt_template: str) -> CompiledPrompt:
+    """Parse a str.format-style template once; keyed on the text so preset templates compile too"""
+    parts = tuple(
+        (literal, field, conversion, format_spec)
+        for literal, field, format_spec, conversion in string.Formatter().parse(prompt_template)
+    )
+    return CompiledPrompt(parts, frozenset(p[1] for p in parts if p[1] is not None))
+
+@functools.lru_cache(maxsize=256)
+def _specialize_prompt(prompt_template: str, fixed_items: tuple) -> CompiledPrompt:
+    """Partially evaluate a template; keyed on the template itself and the fixed values, so presets never hit stale entries"""
+    return _compile_prompt(prompt_template).partial(dict(fixed_items))
 
 
 def update_config(agent_type: str, section: str, key: str, value):
@@ -402,13 +613,16 @@ def update_config(agent_type: str, section: str, key: str, value):
 # Quick presets for different content styles and agent behaviors.
 # =============================================================================
 
+# Presets store only the text appended to a base prompt; the full prompt is
+# built once in apply_preset, so no copies of the large bases exist until used.
+# "prompt_suffixes" keys are "system_prompt" or a name in tool_prompts.
 PRESETS = {
     "viral_focused": {
         "content_creator": {
             "model": {"temperature": 0.8},
-            "system_prompt": CONTENT_CREATOR_CONFIG["system_prompt"] + "\n\nFOCUS: Prioritize viral potential and shareability above all else. Use trending language, memes, and current references.",
-            "tool_prompts": {
-                "content_generation_prompt": CONTENT_CREATOR_CONFIG["tool_prompts"]["content_generation_prompt"] + "\n\nEXTRA FOCUS: Make this as viral and shareable as possible. Use trending formats and language."
+            "prompt_suffixes": {
+                "system_prompt": "\n\nFOCUS: Prioritize viral potential and shareability above all else. Use trending language, memes, and current references.",
+                "content_generation_prompt": "\n\nEXTRA FOCUS: Make this as viral and shareable as possible. Use trending formats and language."
             }
         }
     },
@@ -416,9 +630,9 @@ PRESETS = {
     "educational_focused": {
         "content_creator": {
             "model": {"temperature": 0.5},
-            "system_prompt": CONTENT_CREATOR_CONFIG["system_prompt"] + "\n\nFOCUS: Prioritize accuracy and educational value. Ensure content is informative and well-researched.",
-            "tool_prompts": {
-                "content_generation_prompt": CONTENT_CREATOR_CONFIG["tool_prompts"]["content_generation_prompt"] + "\n\nEXTRA FOCUS: Ensure accuracy and educational value. Make complex topics easy to understand."
+            "prompt_suffixes": {
+                "system_prompt": "\n\nFOCUS: Prioritize accuracy and educational value. Ensure content is informative and well-researched.",
+                "content_generation_prompt": "\n\nEXTRA FOCUS: Ensure accuracy and educational value. Make complex topics easy to understand."
             }
         }
     },
@@ -438,13 +652,31 @@ PRESETS = {
         },
         "content_creator": {
             "model": {"temperature": 0.9},
-            "tool_prompts": {
-                "content_generation_prompt": CONTENT_CREATOR_CONFIG["tool_prompts"]["content_generation_prompt"] + "\n\nEXTRA FOCUS: Be creative and unique. Use unexpected angles and creative approaches."
+            "prompt_suffixes": {
+                "content_generation_prompt": "\n\nEXTRA FOCUS: Be creative and unique. Use unexpected angles and creative approaches."
             }
         }
     }
 }
 
+# References to the original prompts, so re-applying a preset never stacks suffixes
+_BASE_PROMPTS = {
+    "reddit_agent": {"system_prompt": REDDIT_AGENT_CONFIG["system_prompt"]},
+    "content_creator": {
+        "system_prompt": CONTENT_CREATOR_CONFIG["system_prompt"],
+        **CONTENT_CREATOR_CONFIG["tool_prompts"],
+    },
+}
+
+def _apply_prompt_suffixes(agent_key: str, config: dict, suffixes: dict):
+    """Build each preset prompt from its base prompt plus suffix, interned to share storage"""
+    for prompt_name, suffix in suffixes.items():
+        prompt = sys.intern(_BASE_PROMPTS[agent_key][prompt_name] + suffix)
+        if prompt_name == "system_prompt":
+            config["system_prompt"] = prompt
+        else:
+            config["tool_prompts"][prompt_name] = prompt
+
 def apply_preset(preset_name: str):
     """Apply a preset configuration"""
     if preset_name not in PRESETS:
@@ -455,7 +687,9 @@ def apply_preset(preset_name: str):
     # Apply reddit agent changes
     if "reddit_agent" in preset:
         for section, updates in preset["reddit_agent"].items():
-            if isinstance(updates, dict):
+            if section == "prompt_suffixes":
+                _apply_prompt_suffixes("reddit_agent", REDDIT_AGENT_CONFIG, updates)
+            elif isinstance(updates, dict):
                 REDDIT_AGENT_CONFIG[section].update(updates)
             else:
                 REDDIT_AGENT_CONFIG[section] = updates
@@ -463,7 +697,13 @@ def apply_preset(preset_name: str):
     # Apply content creator changes  
     if "content_creator" in preset:
         for section, updates in preset["content_creator"].items():
-            if isinstance(updates, dict):
+            if section == "prompt_suffixes":
+                _apply_prompt_suffixes("content_creator", CONTENT_CREATOR_CONFIG, updates)
+            elif isinstance(updates, dict):
                 CONTENT_CREATOR_CONFIG[section].update(updates)
             else:
                 CONTENT_CREATOR_CONFIG[section] = updates
+
+# Pre-compile the stock tool prompts at import so the first call pays no parsing
+for _template in CONTENT_CREATOR_CONFIG["tool_prompts"].values():
+    _compile_prompt(_template)
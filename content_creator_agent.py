@@ -1,33 +1,113 @@
+import asyncio
 import os
-from dotenv import load_dotenv
-from typing import TypedDict, Annotated, List, Dict, Optional
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import TypedDict, Annotated, Any, Callable, List, Dict, Optional
+import threading
 import time
 import traceback
 import json
 
-from langchain_core.messages import AnyMessage, SystemMessage, HumanMessage, ToolMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-from langgraph.graph import START, StateGraph
-from langgraph.prebuilt import tools_condition
-from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode
-
-from tools import (
-    research_topic_for_content, 
-    research_trending_topics, 
-    generate_platform_content, 
-    analyze_content_performance,
-    generate_article,
-    generate_x_thread,
-    save_content_to_file
-)
+# LangChain, LangGraph, Gemini and the tool modules are imported where they are
+# used, so menu paths that never call an LLM (analytics, config) start quickly.
 from config import get_content_creator_config, get_shared_config
 from content_logger import ContentCreatorLogger
-from datetime import datetime
+from cache import DiskCache, SemanticCache, SingleFlight
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for the analytics/config displays
+    orjson = None
+
+# Compiled LangGraph workflows keyed by tool names; compiled once per process
+_COMPILED_GRAPH_CACHE: Dict[tuple, object] = {}
+
+# Set once .env has been read; a module flag, so child processes don't inherit it
+_env_loaded = False
+
+def _load_env(required_vars: List[str]):
+    """Load .env once per process, and not at all when the environment is already provided (CI, Docker)"""
+    global _env_loaded
+    if _env_loaded or all(os.getenv(var) for var in required_vars):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(override=False)
+    _env_loaded = True
+
+# Topics pinned to the present go stale fast whatever their content type
+VOLATILE_TOPIC_PATTERN = re.compile(
+    r"\b(today|tonight|now|latest|breaking|this (week|month|year)|(19|20)\d{2})\b", re.IGNORECASE
+)
+
+def _to_pretty_json(data) -> str:
+    """Indented JSON for the interactive displays"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=str)
+
+def _is_cacheable(results: str) -> bool:
+    """Research tools report failures as text; only real results are worth caching"""
+    return bool(results) and not results.startswith("Error") and "[ERROR]" not in results
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code. Inside an already running
+    event loop (Jupyter, async web handlers) asyncio.run is not allowed, so the
+    coroutine gets its own loop on a worker thread while the caller waits, as it
+    would for any other blocking call
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="content-loop") as pool:
+        return pool.submit(asyncio.run, coro).result()
 
-# Load environment variables
-load_dotenv()
+def _without_unset(data: Dict[str, Any], optional: tuple) -> Dict[str, Any]:
+    """Drop optional keys that were never set, matching the dicts these records replace"""
+    for key in optional:
+        if data[key] is None:
+            del data[key]
+    return data
+
+@dataclass(slots=True)
+class RunLog:
+    """Log record for one create_content run"""
+    user_message: str
+    topic: str
+    platforms: List[str]
+    content_type: str
+    duration: Optional[str]
+    tone: str
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)
+    files_saved: List[str] = field(default_factory=list)
+    token_usage: int = 0
+    latency: Optional[float] = None
+    success: bool = False
+    agent_response: Optional[str] = None
+    generated_content: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _without_unset(asdict(self), ("agent_response", "generated_content", "error"))
+
+@dataclass(slots=True)
+class FinalResult:
+    """What create_content returns: scripts and saved file paths per platform"""
+    topic: str
+    content_type: str
+    tone: str
+    generated_at: str
+    content: Dict[str, str] = field(default_factory=dict)
+    files: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _without_unset(asdict(self), ("error",))
 
 class ContentCreatorAgent:
     def __init__(self, config_preset: Optional[str] = None):
@@ -50,6 +130,7 @@ class ContentCreatorAgent:
             self.config = get_content_creator_config()
         
         # Validate environment
+        _load_env(self.shared_config["environment"]["required_env_vars"])
         self.api_key = os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
@@ -59,8 +140,24 @@ class ContentCreatorAgent:
             if not os.getenv(var):
                 raise ValueError(f"{var} environment variable not set")
         
-        # Initialize memory with system message
-        self.memory: List[AnyMessage] = [SystemMessage(content=self.config["system_prompt"])]
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from tools import (
+            research_topic_for_content,
+            research_trending_topics,
+            generate_platform_content,
+            analyze_content_performance,
+            generate_article,
+            generate_x_thread,
+            generate_content_bundle,
+            save_content_to_file
+        )
+        
+        # The system prompt (with the date) is a fixed prefix kept out of memory, so every
+        # request starts with the same bytes and Gemini can reuse its cache; see system_message
+        self._system_message = None
+        self._system_expires = 0.0
+        # Bounded so research summaries from past runs cannot grow prompts without limit
+        self.memory = deque(maxlen=self.config.get("memory_window", 20))
         
         # Initialize LLM with config settings
         model_config = self.config["model"]
@@ -86,37 +183,123 @@ class ContentCreatorAgent:
             analyze_content_performance,
             generate_article,
             generate_x_thread,
+            generate_content_bundle,
             save_content_to_file
         ]
         self.chat_with_tools = self.llm.bind_tools(self.tools)
         
+        # Per-platform generator tool, fixed tool arguments and output folder, resolved once.
+        # A "content_type" key marks tools that take the per-call content type.
+        specs = self.config["platform_specs"]
+        output_paths = self.config["output_paths"]
+        self._platform_dispatch = {
+            platform: (generate_platform_content, {"platform": platform, "content_type": None},
+                       output_paths.get(f"{platform}s", "output"))
+            for platform in ("youtube", "tiktok")
+        }
+        self._platform_dispatch["article"] = (
+            generate_article,
+            {"style": specs.get("article", {}).get("style"), "optimal_length": specs.get("article", {}).get("optimal_length")},
+            output_paths.get("articles", "articles"),
+        )
+        self._platform_dispatch["x"] = (
+            generate_x_thread,
+            {"style": specs.get("x", {}).get("style"), "thread_length": specs.get("x", {}).get("thread_length")},
+            output_paths.get("x_threads", "x_threads"),
+        )
+        
+        # Specialize every generation prompt the dispatch table can produce
+        self._warm_prompts()
+        
         # Build agent
         self.agent = self._build_agent()
         
+        # Concurrent identical research requests share one tool call
+        self._inflight = SingleFlight()
+        
+        # File writes get their own threads so they never queue behind LLM calls
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="content-io")
+        self._prefetch_trending = None
+        self._prefetch_started = 0.0
+        
+        # Research results are reused across sessions until their TTL runs out
+        caching = self.config.get("caching", {})
+        self._research_cache = DiskCache(caching["path"]) if caching.get("enabled") else None
+        self._semantic_cache = None
+        semantic = caching.get("semantic", {})
+        if self._research_cache is not None and semantic.get("enabled"):
+            try:
+                self._semantic_cache = SemanticCache(
+                    semantic["path"], model=semantic["model"], threshold=semantic["threshold"]
+                )
+            except ImportError as e:
+                print(f"⚠️ Semantic cache disabled: {str(e)}")
+        
         # Initialize logger
         if self.config["logging"]["enabled"]:
             self.logger = ContentCreatorLogger(self.config["logging"]["log_file"])
     
+    def _warm_prompts(self):
+        """Pre-specialize the generation prompt for each (platform, content_type, tone) combination"""
+        from itertools import product
+        from tools import article_prompt, video_prompt, x_thread_prompt
+
+        tones = list(self.config["tone_settings"])
+        for platform, content_type, tone in product(("youtube", "tiktok"), self.config["content_types"], tones):
+            video_prompt(platform, content_type, tone)
+        for tone in tones:
+            article_prompt(tone, **self._platform_dispatch["article"][1])
+            x_thread_prompt(tone, **self._platform_dispatch["x"][1])
+    
+    @property
+    def system_message(self):
+        """System prompt plus today's UTC date, rebuilt only when the date rolls over"""
+        now = time.time()
+        if now >= self._system_expires:
+            from langchain_core.messages import SystemMessage
+
+            today = time.strftime("%Y-%m-%d", time.gmtime(now))
+            self._system_message = SystemMessage(content=f"{self.config['system_prompt']}\n\nToday's date is {today}")
+            self._system_expires = (now // 86400 + 1) * 86400  # next UTC midnight
+        return self._system_message
+    
     def _build_agent(self):
-        """Build the LangGraph agent workflow"""
+        """
+        Build the LangGraph agent workflow, bound to this instance.
+        The compiled graph is shared by every agent with the same tools; the assistant
+        node reads the instance from config["configurable"]["agent"].
+        """
+        key = tuple(tool.name for tool in self.tools)
+        graph = _COMPILED_GRAPH_CACHE.get(key)
+        if graph is None:
+            graph = _COMPILED_GRAPH_CACHE[key] = self._compile_graph(self.tools)
+        return graph.with_config(configurable={"agent": self})
+
+    @staticmethod
+    def _compile_graph(tools):
+        """Compile the assistant/tools loop; holds no reference to any agent instance"""
+        from langchain_core.messages import AnyMessage
+        from langchain_core.runnables import RunnableConfig
+        from langgraph.graph import START, StateGraph
+        from langgraph.graph.message import add_messages
+        from langgraph.prebuilt import ToolNode, tools_condition
         
         class AgentState(TypedDict):
             messages: Annotated[list[AnyMessage], add_messages]
         
-        def assistant(state: AgentState):
+        def assistant(state: AgentState, config: RunnableConfig):
             """Main assistant node"""
-            messages = state["messages"]
-            
-            if not messages or not isinstance(messages[0], SystemMessage):
-                messages = [SystemMessage(content=self.config["system_prompt"])] + messages
+            agent = config["configurable"]["agent"]
+            # The fixed system prefix is passed on every call and never stored in state
+            messages = [agent.system_message, *state["messages"]]
             
             return {
-                "messages": [self.chat_with_tools.invoke(messages)],
+                "messages": [agent.chat_with_tools.invoke(messages)],
             }
         
         builder = StateGraph(AgentState)
         builder.add_node("assistant", assistant)
-        builder.add_node("tools", ToolNode(self.tools))
+        builder.add_node("tools", ToolNode(tools))
         builder.add_edge(START, "assistant")
         builder.add_conditional_edges(
             "assistant",
@@ -131,12 +314,13 @@ class ContentCreatorAgent:
         if (self.config["logging"]["enabled"] and 
             self.config["logging"].get("separate_error_log", False)):
             
-            error_log_file = self.config["logging"].get("error_log_file", "content_creator_errors.json")
+            error_log_file = self.config["logging"].get("error_log_file", "content_creator_errors.jsonl")
             error_logger = ContentCreatorLogger(error_log_file)
             ContentCreatorLogger.log_error(error_data)
     
     def create_content(self, topic: str, platforms: List[str], content_type: str = "educational", 
-                      duration: str = None, tone: str = "engaging") -> Dict[str, str]:
+                      duration: str = None, tone: str = "engaging",
+                      on_platform_done: Optional[Callable[[str, str, str], None]] = None) -> Dict[str, str]:
         """
         Main method to create content for a given topic for multiple platforms.
         
@@ -146,150 +330,302 @@ class ContentCreatorAgent:
             content_type: Type of content to create
             duration: Target video duration (uses config defaults if None)
             tone: Tone/style of the content
+            on_platform_done: Optional callback(platform, content, file_path), called as each
+                platform finishes so output can be shown before the slowest one completes
             
         Returns:
             Dictionary with platform-specific scripts, metadata, and file paths.
         """
         
-        start_time = time.time()
-        current_date = datetime.utcnow().isoformat()
-        
-        self.memory.append(SystemMessage(content=f"Today's date is {current_date}"))
-        
-        run_log = {
-            "user_message": f"Create {', '.join(platforms)} content about {topic}",
-            "topic": topic,
-            "platforms": platforms,
-            "content_type": content_type,
-            "duration": duration,
-            "tone": tone,
-            "tool_calls": [],
-            "files_saved": [],
-            "token_usage": 0,
-            "latency": None,
-            "success": False
-        }
+        from langchain_core.messages import SystemMessage
+
+        start_time = time.monotonic()
+        current_date = datetime.now(timezone.utc).isoformat()
         
-        final_result = {
-            "topic": topic,
-            "content_type": content_type,
-            "tone": tone,
-            "generated_at": current_date,
-            "content": {},
-            "files": {}
-        }
+        run_log = RunLog(
+            user_message=f"Create {', '.join(platforms)} content about {topic}",
+            topic=topic,
+            platforms=platforms,
+            content_type=content_type,
+            duration=duration,
+            tone=tone
+        )
+        
+        final_result = FinalResult(
+            topic=topic,
+            content_type=content_type,
+            tone=tone,
+            generated_at=current_date
+        )
 
         try:
-            # Initial research for the topic
-            research_results = self.research_topic(topic, platform_focus=', '.join(platforms))
-            self.memory.append(SystemMessage(content=f"Research summary for {topic}:\n{research_results}"))
+            # Platforms generated recently with the same settings are reused as-is
+            ttl = self._research_ttl(topic, content_type)
+            cached = {}
+            to_generate = []
+            for platform in platforms:
+                entry = self._cached_content(topic, platform, content_type, tone, ttl)
+                if entry is None:
+                    to_generate.append(platform)
+                else:
+                    cached[platform] = entry
+                    if on_platform_done:
+                        on_platform_done(platform, *entry)
+
+            generated = {}
+            if to_generate:
+                # Initial research for the topic (skipped when every platform is cached)
+                research_results = self.research_topic(
+                    topic, platform_focus=', '.join(platforms), content_type=content_type
+                )
+                self.memory.append(SystemMessage(content=f"Research summary for {topic}:\n{research_results}"))
+
+                # Platforms are independent LLM calls, so they run concurrently
+                results = _run_coroutine(self._generate_all_platforms(
+                    to_generate, topic, content_type, tone, research_results, on_platform_done
+                ))
+                for platform, content, save_path in results:
+                    generated[platform] = (content, save_path)
+                    self._store_content(topic, platform, content_type, tone, content, save_path, ttl)
 
             for platform in platforms:
-                platform_config = self.config["platform_specs"].get(platform, {})
-                content = ""
-
-                if platform in ["youtube", "tiktok"]:
-                    content = generate_platform_content.invoke({
-                        "topic": topic, "platform": platform, "content_type": content_type,
-                        "tone": tone, "research_summary": research_results
-                    })
-                elif platform == "article":
-                    content = generate_article.invoke({
-                        "topic": topic, "tone": tone, "style": platform_config.get("style"),
-                        "optimal_length": platform_config.get("optimal_length"), "research_summary": research_results
-                    })
-                elif platform == "x":
-                    content = generate_x_thread.invoke({
-                        "topic": topic, "tone": tone, "style": platform_config.get("style"),
-                        "thread_length": platform_config.get("thread_length"), "research_summary": research_results
-                    })
-                
+                content, save_path = cached.get(platform) or generated.get(platform, ("", None))
                 if content:
-                    final_result["content"][platform] = content
-                    # Save the content
-                    folder = self.config["output_paths"].get(f"{platform}s", "output")
-                    if platform == "article":
-                        folder = self.config["output_paths"].get("articles", "articles")
-                    elif platform == "x":
-                         folder = self.config["output_paths"].get("x_threads", "x_threads")
-
-                    save_path = save_content_to_file.invoke({
-                        "content": content, "folder": folder, "topic": topic, "platform": platform
-                    })
-                    final_result["files"][platform] = save_path
-                    run_log["files_saved"].append(save_path)
-
-            run_log["agent_response"] = f"Generated content for {', '.join(platforms)}. See files for details."
-            run_log["generated_content"] = final_result
-            run_log["success"] = True
+                    final_result.content[platform] = content
+                    final_result.files[platform] = save_path
+                    run_log.files_saved.append(save_path)
+
+            run_log.agent_response = f"Generated content for {', '.join(platforms)}. See files for details."
+            run_log.generated_content = final_result.to_dict()
+            run_log.success = True
 
         except Exception as e:
             error_data = {
                 "error_type": "content_creation_error",
                 "topic": topic, "platforms": platforms, "content_type": content_type,
                 "error": str(e), "traceback": traceback.format_exc(),
-                "latency": round(time.time() - start_time, 3)
+                "latency": round(time.monotonic() - start_time, 3)
             }
             self._log_error_separately(error_data)
             if self.config["logging"].get("log_errors", True):
-                run_log["error"] = str(e)
-                run_log["agent_response"] = f"[ERROR] {str(e)}"
-            final_result["error"] = str(e)
+                run_log.error = str(e)
+                run_log.agent_response = f"[ERROR] {str(e)}"
+            final_result.error = str(e)
         
         finally:
-            run_log["latency"] = round(time.time() - start_time, 3)
-            if self.config["logging"]["enabled"] and (run_log["success"] or self.config["logging"].get("log_errors", True)):
-                ContentCreatorLogger.log_content_creation(run_log)
+            run_log.latency = round(time.monotonic() - start_time, 3)
+            if self.config["logging"]["enabled"] and (run_log.success or self.config["logging"].get("log_errors", True)):
+                ContentCreatorLogger.log_content_creation(run_log.to_dict())
         
-        return final_result
+        return final_result.to_dict()
 
-    def research_topic(self, topic: str, platform_focus: str = "all") -> str:
-        """Research a topic with logging"""
-        start_time = time.time()
+    async def _generate_for_platform(self, platform: str, topic: str, content_type: str,
+                                     tone: str, research_results: str):
+        """
+        Generate and save content for a single platform
+        
+        Returns:
+            Tuple of (platform, content, save_path); content is empty for unknown platforms
+        """
+        from tools import save_content_to_file
+
+        dispatch = self._platform_dispatch.get(platform)
+        if dispatch is None:
+            return platform, "", None
+        tool, static_args, folder = dispatch
+
+        tool_input = {"topic": topic, "tone": tone, "research_summary": research_results, **static_args}
+        if "content_type" in static_args:
+            tool_input["content_type"] = content_type
+        content = await tool.ainvoke(tool_input)
+        
+        save_path = None
+        if content:
+            save_path = await asyncio.wrap_future(self._io_pool.submit(save_content_to_file.invoke, {
+                "content": content, "folder": folder, "topic": topic, "platform": platform
+            }))
+        return platform, content, save_path
+
+    async def _generate_all_platforms(self, platforms: List[str], topic: str, content_type: str,
+                                      tone: str, research_results: str,
+                                      on_platform_done: Optional[Callable[[str, str, str], None]] = None):
+        """Run _generate_for_platform for every platform at once; results keep the input order"""
+        tasks = [
+            asyncio.ensure_future(self._generate_for_platform(platform, topic, content_type, tone, research_results))
+            for platform in platforms
+        ]
+        # Report platforms in completion order, not request order
+        for next_done in asyncio.as_completed(tasks):
+            platform, content, save_path = await next_done
+            if on_platform_done and content:
+                on_platform_done(platform, content, save_path)
+        return [task.result() for task in tasks]
+
+    def research_topic(self, topic: str, platform_focus: str = "all", content_type: Optional[str] = None) -> str:
+        """
+        Research a topic with logging; repeat (topic, platform_focus) pairs are served from the cache
+        for as long as the content type allows (see _research_ttl)
+        """
+        from tools import research_topic_for_content
+
+        start_time = time.monotonic()
+        scope = f"research:{platform_focus.strip().lower()}"
+        ttl = self._research_ttl(topic, content_type)
         try:
-            results = research_topic_for_content.invoke({"topic": topic, "platform_focus": platform_focus})
+            results = self._cached_research(scope, topic, max_age=ttl)
+            cache_hit = results is not None
+            if not cache_hit:
+                results = self._inflight.do(
+                    (scope, topic.strip().lower()), self._run_research, research_topic_for_content,
+                    {"topic": topic, "platform_focus": platform_focus}, scope, topic, ttl
+                )
             if self.config["logging"]["enabled"]:
                 ContentCreatorLogger.log_research_call({
                     "topic": topic, "platform_focus": platform_focus,
                     "results_length": len(results) if results else 0,
                     "results_preview": results[:200] if results else "",
-                    "latency": round(time.time() - start_time, 3), "success": True
+                    "latency": round(time.monotonic() - start_time, 3), "success": True,
+                    "cache_hit": cache_hit
                 })
             return results
         except Exception as e:
             error_msg = f"Research error: {str(e)}"
             self._log_error_separately({
                 "error_type": "research_error", "topic": topic, "platform_focus": platform_focus,
-                "error": error_msg, "latency": round(time.time() - start_time, 3)
+                "error": error_msg, "latency": round(time.monotonic() - start_time, 3)
             })
             return error_msg
     
+    def _research_ttl(self, topic: str, content_type: Optional[str] = None) -> float:
+        """
+        Seconds research on a topic stays fresh: looked up by content type in
+        caching.ttl_rules, and capped at the "news" TTL for time-sensitive topics
+        """
+        rules = self.config["caching"]["ttl_rules"]
+        ttl = rules.get(content_type, rules["default"])
+        if VOLATILE_TOPIC_PATTERN.search(topic):
+            ttl = min(ttl, rules["news"])
+        return ttl
+    
+    def _content_cache_key(self, topic: str, platform: str, content_type: str, tone: str) -> str:
+        return f"content:{platform}:{content_type}:{tone}|{topic.strip().lower()}"
+    
+    def _cached_content(self, topic: str, platform: str, content_type: str, tone: str, max_age: float):
+        """Return (content, save_path) generated earlier with the same settings, or None"""
+        if self._research_cache is None or not self.config["caching"].get("generated_content"):
+            return None
+        entry = self._research_cache.get(self._content_cache_key(topic, platform, content_type, tone))
+        if entry is None or time.time() - entry["ts"] > max_age:
+            return None
+        return entry["content"], entry["save_path"]
+    
+    def _store_content(self, topic: str, platform: str, content_type: str, tone: str,
+                       content: str, save_path: Optional[str], ttl: float):
+        """Cache generated content under the same TTL as the research it was built from"""
+        if (self._research_cache is None or not self.config["caching"].get("generated_content")
+                or not _is_cacheable(content)):
+            return
+        self._research_cache.set(
+            self._content_cache_key(topic, platform, content_type, tone),
+            {"content": content, "save_path": save_path, "ts": time.time()}, ttl
+        )
+    
+    def _maybe_prefetch_trending(self):
+        """Refresh the trending report in the background if it is stale, at most once per min_interval"""
+        prefetch = self.config.get("prefetch_trending", {})
+        if not prefetch.get("enabled") or self._research_cache is None:
+            return
+        if self._prefetch_trending is not None and not self._prefetch_trending.done():
+            return
+        if time.time() - self._prefetch_started < prefetch.get("min_interval", 300):
+            return
+        
+        category = prefetch.get("category", "general")
+        if self._cached_research("trending", category, max_age=self._research_ttl(category, "trending")) is not None:
+            return
+        self._prefetch_started = time.time()
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self.research_trending(category))
+            except Exception as e:
+                future.set_exception(e)
+
+        # A daemon thread rather than _io_pool, whose threads are joined at exit:
+        # quitting must not wait for speculative research nobody will read
+        threading.Thread(target=run, name="trending-prefetch", daemon=True).start()
+        self._prefetch_trending = future
+    
+    def _cached_research(self, scope: str, text: str, max_age: Optional[float] = None) -> Optional[str]:
+        """
+        Return cached research for text within scope, or None on a miss or when caching is off.
+        Exact (normalized) matches are checked first, then similar topics if semantic caching is on.
+        Entries older than max_age count as misses, so a short-lived request never gets research
+        that was cached under a longer TTL.
+        """
+        if self._research_cache is None:
+            return None
+        entry = self._research_cache.get(f"{scope}|{text.strip().lower()}")
+        if entry is None and self._semantic_cache is not None:
+            entry = self._semantic_cache.get(scope, text)
+        if entry is None or (max_age is not None and time.time() - entry["ts"] > max_age):
+            return None
+        return entry["results"]
+    
+    def _run_research(self, research_tool, tool_input: Dict[str, str], scope: str, text: str, ttl: float) -> str:
+        """Invoke a research tool and cache its results (run once per key by self._inflight)"""
+        results = research_tool.invoke(tool_input)
+        self._store_research(scope, text, results, ttl)
+        return results
+    
+    def _store_research(self, scope: str, text: str, results: str, ttl: float):
+        """Cache successful research results for ttl seconds"""
+        if self._research_cache is None or not _is_cacheable(results):
+            return
+        entry = {"results": results, "ts": time.time()}
+        self._research_cache.set(f"{scope}|{text.strip().lower()}", entry, ttl)
+        if self._semantic_cache is not None:
+            self._semantic_cache.add(scope, text, entry, ttl)
+    
     def analyze_content(self, content: str, platform: str) -> str:
         """Analyze content performance potential"""
+        from tools import analyze_content_performance
+
         try:
             return analyze_content_performance.invoke({"content_text": content, "platform": platform})
         except Exception as e:
             return f"Analysis error: {str(e)}"
     
     def research_trending(self, category: str = "general") -> str:
-        """Research trending topics with logging"""
-        start_time = time.time()
+        """Research trending topics with logging; cached briefly since trends move fast"""
+        from tools import research_trending_topics
+
+        start_time = time.monotonic()
         try:
-            results = research_trending_topics.invoke({"category": category})
+            ttl = self._research_ttl(category, "trending")
+            results = self._cached_research("trending", category, max_age=ttl)
+            cache_hit = results is not None
+            if not cache_hit:
+                results = self._inflight.do(
+                    ("trending", category.strip().lower()), self._run_research, research_trending_topics,
+                    {"category": category}, "trending", category, ttl
+                )
             if self.config["logging"]["enabled"]:
                 ContentCreatorLogger.log_research_call({
                     "topic": f"trending_{category}",
                     "platform_focus": category,
                     "results_length": len(results) if results else 0,
                     "results_preview": results[:200] if results else "",
-                    "latency": round(time.time() - start_time, 3), "success": True
+                    "latency": round(time.monotonic() - start_time, 3), "success": True,
+                    "cache_hit": cache_hit
                 })
             return results
         except Exception as e:
             error_msg = f"Trending research error: {str(e)}"
             self._log_error_separately({
                 "error_type": "trending_research_error", "category": category,
-                "error": error_msg, "latency": round(time.time() - start_time, 3)
+                "error": error_msg, "latency": round(time.monotonic() - start_time, 3)
             })
             return error_msg
     
@@ -318,6 +654,7 @@ class ContentCreatorAgent:
                 print("5. View Analytics - See usage statistics")
                 print("6. Configuration - View current settings")
                 
+                self._maybe_prefetch_trending()
                 choice = input("\nChoose option (1-6) or 'quit': ").strip()
                 
                 if choice.lower() in ['quit', 'exit', 'q']:
@@ -328,8 +665,11 @@ class ContentCreatorAgent:
                     topic = input("Enter topic: ").strip()
                     if topic:
                         print("\n🔄 Researching and creating content for all platforms...")
-                        result = self.create_content(topic, platforms=["youtube", "tiktok", "article", "x"])
-                        self._display_content(result)
+                        result = self.create_content(
+                            topic, platforms=["youtube", "tiktok", "article", "x"],
+                            on_platform_done=self._display_platform
+                        )
+                        self._display_content(result, show_platforms=False)
                 
                 elif choice == "2":
                     topic = input("Topic: ").strip()
@@ -346,13 +686,24 @@ class ContentCreatorAgent:
                     
                     if topic:
                         print(f"\n🔄 Creating content for {', '.join(platforms)}...")
-                        result = self.create_content(topic, platforms, content_type, duration, tone)
-                        self._display_content(result)
+                        result = self.create_content(
+                            topic, platforms, content_type, duration, tone,
+                            on_platform_done=self._display_platform
+                        )
+                        self._display_content(result, show_platforms=False)
                 
                 elif choice == "3":
                     category = input("Enter category to research (e.g., AI, gaming, or leave blank for general): ").strip() or "general"
                     print(f"\n🔍 Researching trends for {category}...")
-                    trends = self.research_trending(category)
+                    prefetched = self._prefetch_trending
+                    trends = None
+                    if (prefetched is not None and prefetched.done() and not prefetched.exception()
+                            and category == self.config["prefetch_trending"]["category"]):
+                        trends = prefetched.result()
+                    if trends is None or not _is_cacheable(trends):
+                        # A failed prefetch (error text) counts as a miss; one still in
+                        # flight is joined rather than repeated (see SingleFlight)
+                        trends = self.research_trending(category)
                     print(f"\n📈 Current Trends:\n{trends}")
                 
                 elif choice == "4":
@@ -391,12 +742,12 @@ class ContentCreatorAgent:
                 elif choice == "5":
                     print("\n📊 Usage Analytics:")
                     analytics = self.get_analytics()
-                    print(json.dumps(analytics, indent=2))
+                    print(_to_pretty_json(analytics))
                 
                 elif choice == "6":
                     print("\n⚙️ Current Configuration:")
                     config_display = {"model": self.config["model"], "logging": self.config["logging"], "platform_specs": self.config["platform_specs"]}
-                    print(json.dumps(config_display, indent=2))
+                    print(_to_pretty_json(config_display))
                 
                 else:
                     print("Invalid choice. Please try again.")
@@ -408,17 +759,30 @@ class ContentCreatorAgent:
                 print(f"Error: {str(e)}")
                 self._log_error_separately({"error_type": "interactive_error", "error": str(e), "traceback": traceback.format_exc()})
     
-    def _display_content(self, result: Dict[str, any]):
-        """Display generated content in a formatted way"""
+    def _display_platform(self, platform: str, script: str, file_path: Optional[str] = None):
+        """Display one platform's generated content (used as the create_content progress callback)"""
+        print(f"\n📱 {platform.upper()} SCRIPT:")
+        print("-" * 30)
+        print(script)
+        print("-" * 30)
+        if file_path:
+            print(f"💾 Saved {platform.upper()} content to: {file_path}")
+
+    def _display_content(self, result: Dict[str, any], show_platforms: bool = True):
+        """
+        Display generated content in a formatted way
+        
+        Args:
+            result: Result dictionary from create_content
+            show_platforms: Set False when the scripts were already shown via _display_platform
+        """
         print("\n" + "="*60)
         print(f"🎯 CONTENT GENERATED FOR: {result.get('topic', 'Unknown Topic').upper()}")
         print("="*60)
         
-        for platform, script in result.get("content", {}).items():
-            print(f"\n📱 {platform.upper()} SCRIPT:")
-            print("-" * 30)
-            print(script)
-            print("-" * 30)
+        if show_platforms:
+            for platform, script in result.get("content", {}).items():
+                self._display_platform(platform, script)
 
         for platform, file_path in result.get("files", {}).items():
             print(f"\n💾 Saved {platform.upper()} content to: {file_path}")
@@ -3,27 +3,500 @@ Logging system for Content Creator Agent
 Separate from Reddit Agent logging for better organization and tracking
 """
 
+import atexit
+import bisect
+import functools
+import heapq
 import json
 import os
+import queue
+import sqlite3
+import threading
+import time
+import traceback
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Collection, Iterator, Optional, List
 import uuid
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json produces the same lines
+    orjson = None
+
+# Each log is a directory of per-day append-only JSON Lines files, logs/<name>/YYYY-MM-DD.jsonl,
+# so date-range reads only open the days in range
+_FLUSH_EVERY = 50  # entries
+_FLUSH_INTERVAL = 1.0  # seconds
+_MAX_LOG_BYTES = 10 * 1024 * 1024
+_BACKUP_COUNT = 5
+_MAX_LOG_DIR_BYTES = 200 * 1024 * 1024  # per log; the oldest files are deleted past this
+_RECENT_BUFFER_SIZE = 2000  # newest entries per log file kept in memory for get_logs
+_IO_BUFFER_SIZE = 64 * 1024  # Bytes; batches many small log lines into few write/read syscalls
+_AFTER_ALL = "\uffff"  # Sorts after every ISO timestamp
+
+def _dumps(entry: Dict[str, Any]) -> bytes:
+    """Serialize one log entry as a newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(
+            entry, default=str, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return (json.dumps(entry, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+
+def _loads(line: bytes) -> Any:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+def _copy(value: Any) -> Any:
+    """
+    Fresh JSON-shaped copy of cached results, so callers can mutate what they get back;
+    non-JSON values come back as strings, as when the entry is read from disk
+    """
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+    return json.loads(json.dumps(value, default=str))
+
+class _LogWriter:
+    """Append handle for one log file, opened once and shared by every logger writing to it"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "ab", buffering=_IO_BUFFER_SIZE)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        # Set when this file was created or rotated; the writer thread then enforces retention
+        self.needs_retention = True
+
+    def write(self, lines: List[bytes]) -> None:
+        with self._lock:
+            self._file.writelines(lines)
+            self._pending += len(lines)
+            if self._pending >= _FLUSH_EVERY or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL:
+                self._flush()
+
+    def flush(self, sync: bool = False) -> None:
+        with self._lock:
+            if self._pending:
+                self._flush()
+            if sync and not self._file.closed:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            self._pending = 0
+
+    def _flush(self) -> None:
+        self._file.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if self._file.tell() >= _MAX_LOG_BYTES:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        """Shift path -> path.1 -> ... -> path.N like RotatingFileHandler, dropping the oldest"""
+        # A finished file is never appended to again, so make it durable before it is renamed
+        os.fsync(self._file.fileno())
+        self._file.close()
+        oldest = f"{self.path}.{_BACKUP_COUNT}"
+        drops_oldest = os.path.exists(oldest)
+        for i in range(_BACKUP_COUNT - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "ab", buffering=_IO_BUFFER_SIZE)
+        self.needs_retention = True
+
+        index = _INDEXES.get(os.path.dirname(self.path))
+        if drops_oldest and index is not None:
+            # The dropped file held this day's entries older than the new oldest part
+            bucket = os.path.basename(self.path)[:10]
+            index.trim(_first_timestamp(oldest) or bucket + _AFTER_ALL, after=bucket)
+
+def _first_timestamp(path: str) -> Optional[str]:
+    """Timestamp of a log file's first entry, or None when it has none"""
+    with open(path, 'rb') as f:
+        entry = ContentCreatorLogger._parse_line(f.readline())
+    return entry.get("timestamp") if entry is not None else None
+
+_WRITERS: Dict[str, _LogWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+def _get_writer(path: str) -> _LogWriter:
+    writer = _WRITERS.get(path)
+    if writer is None:
+        with _WRITERS_LOCK:
+            writer = _WRITERS.get(path)
+            if writer is None:
+                writer = _WRITERS[path] = _LogWriter(path)
+    return writer
+
+def _flush_all(sync: bool = False) -> None:
+    for writer in list(_WRITERS.values()):
+        writer.flush(sync)
+
+def _close_writers(directory: str) -> None:
+    """Close and forget every writer for files in directory"""
+    with _WRITERS_LOCK:
+        for path in [path for path in _WRITERS if os.path.dirname(path) == directory]:
+            _WRITERS.pop(path).close()
+
+def _log_files_oldest_first(directory: str) -> List[str]:
+    """Bucket files and their rotated parts (YYYY-MM-DD.jsonl[.N]), oldest first"""
+    parts = []
+    for name in os.listdir(directory):
+        suffix = name[16:]
+        if name[10:16] == ".jsonl" and (not suffix or (suffix[0] == "." and suffix[1:].isdigit())):
+            parts.append((name[:10], -int(suffix[1:] or 0), name))
+    return [os.path.join(directory, name) for _, _, name in sorted(parts)]
+
+def _enforce_retention(directory: str) -> None:
+    """Delete the oldest log files until the directory fits in _MAX_LOG_DIR_BYTES, and drop their index rows"""
+    files = _log_files_oldest_first(directory)
+    sizes = [os.path.getsize(path) for path in files]
+    total = sum(sizes)
+    removed = 0
+    # The newest file is the one being written and is always kept
+    for path, size in zip(files[:-1], sizes):
+        if total <= _MAX_LOG_DIR_BYTES:
+            break
+        with _WRITERS_LOCK:
+            writer = _WRITERS.pop(path, None)
+        if writer is not None:
+            writer.close()
+        os.remove(path)
+        total -= size
+        removed += 1
+    if not removed:
+        return
+    
+    index = _INDEXES.get(directory)
+    if index is not None:
+        # Survivors can be empty (a just-rotated live file); with no entries left, every row goes
+        surviving = (_first_timestamp(path) for path in files[removed:])
+        index.trim(next((timestamp for timestamp in surviving if timestamp is not None), _AFTER_ALL))
+
+# --- Background writing ---
+# Loggers only enqueue (logger, entry); one daemon thread serializes and writes them
+# in batches, so callers never wait on file or SQLite I/O
+_LOG_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_LOG_THREAD_LOCK = threading.Lock()
+_log_thread: Optional[threading.Thread] = None
+
+def _enqueue(items: List[tuple]) -> None:
+    global _log_thread
+    if _log_thread is None:
+        with _LOG_THREAD_LOCK:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_drain_queue, name="log-writer", daemon=True)
+                _log_thread.start()
+    for item in items:
+        _LOG_QUEUE.put(item)
+
+def _drain_queue() -> None:
+    """Write queued entries in batches; when idle, flush so a quiet writer never holds entries for long"""
+    while True:
+        try:
+            batch = [_LOG_QUEUE.get(timeout=_FLUSH_INTERVAL)]
+        except queue.Empty:
+            _flush_all()
+            continue
+        while len(batch) < _FLUSH_EVERY:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            by_logger: Dict[Any, List[Dict[str, Any]]] = {}
+            for logger, entry in batch:
+                by_logger.setdefault(logger, []).append(entry)
+            for logger, entries in by_logger.items():
+                logger._append(entries)
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+def _wait_for_queue() -> None:
+    """Block until every queued entry has been written; readers call this first"""
+    if _log_thread is not None:
+        _LOG_QUEUE.join()
+
+def _shutdown() -> None:
+    _wait_for_queue()
+    _flush_all(sync=True)
+
+# Make sure queued entries reach disk before the interpreter exits
+atexit.register(_shutdown)
+
+
+class _RecentBuffer:
+    """
+    The newest entries of one log, sorted by timestamp (ISO-8601 sorts as text)
+    so date-range queries are a bisect and a slice instead of a file scan.
+    Every entry with timestamp > floor is held; floor is None while the whole log fits.
+    data_version is the index's at seeding; this process's writes are added as they
+    happen, so a different data_version means another process wrote and the buffer is stale.
+    """
+
+    def __init__(self, newest_first: Iterator[Dict[str, Any]], data_version: int):
+        self.data_version = data_version
+        self._lock = threading.Lock()
+        self._keys: List[str] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._floor: Optional[str] = None
+        tail = []
+        for entry in newest_first:
+            tail.append(entry)
+            if len(tail) > _RECENT_BUFFER_SIZE:
+                break
+        self.add(tail)
+
+    def add(self, entries: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for entry in entries:
+                timestamp = entry.get("timestamp", "")
+                index = bisect.bisect_right(self._keys, timestamp)
+                self._keys.insert(index, timestamp)
+                self._entries.insert(index, entry)
+            overflow = len(self._keys) - _RECENT_BUFFER_SIZE
+            if overflow > 0:
+                self._floor = self._keys[overflow - 1]
+                del self._keys[:overflow]
+                del self._entries[:overflow]
+
+    def query(self, start_date: Optional[str], end_date: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Entries with start_date <= timestamp <= end_date, newest first
+        
+        Returns:
+            The matching entries, or None when the range reaches back past the buffer
+        """
+        with self._lock:
+            if self._floor is not None and not (start_date and start_date > self._floor):
+                return None
+            low = bisect.bisect_left(self._keys, start_date) if start_date else 0
+            high = bisect.bisect_right(self._keys, end_date) if end_date else len(self._keys)
+            return self._entries[low:high][::-1]
+
+_RECENT: Dict[str, _RecentBuffer] = {}
+_RECENT_LOCK = threading.Lock()
+
+def _get_recent(logger: "ContentCreatorLogger") -> _RecentBuffer:
+    """
+    Shared buffer for the logger's log, seeded from the newest entries on first use
+    and reseeded whenever another process has written to the log since
+    """
+    index = _get_index(logger)
+    recent = _RECENT.get(logger.log_dir)
+    if recent is None or recent.data_version != index.data_version():
+        with _RECENT_LOCK:
+            data_version = index.data_version()
+            recent = _RECENT.get(logger.log_dir)
+            if recent is None or recent.data_version != data_version:
+                recent = _RECENT[logger.log_dir] = _RecentBuffer(logger._read_logs_reversed(), data_version)
+    return recent
+
+
+class _LogIndex:
+    """
+    SQLite table of the fields analytics aggregates over, one row per log entry,
+    kept next to the JSONL buckets (which stay the full record), plus an
+    aggregates table of running counts and sums updated in the same transaction
+    as each insert, so analytics reads a handful of rows instead of scanning
+    """
+
+    def __init__(self, logger: "ContentCreatorLogger"):
+        self._lock = threading.Lock()
+        self.path = os.path.join(logger.log_dir, "index.sqlite3")
+        self._generation = 0  # bumped by this process's writes; file stats catch other processes'
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS logs ("
+                "timestamp TEXT, session_id TEXT, log_type TEXT, platform TEXT, "
+                "content_type TEXT, latency REAL, token_usage REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ts ON logs(timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_type ON logs(log_type)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_session ON logs(session_id)")
+            # kind is log_type/platform/content_type (count per key) or latency/token_usage (count and sum)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS aggregates ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, n INTEGER NOT NULL, total REAL NOT NULL, "
+                "first TEXT, last TEXT, PRIMARY KEY (kind, key))"
+            )
+            schema_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            # 0: the index is new, so load whatever the buckets already hold
+            if schema_version == 0:
+                self._conn.executemany(
+                    "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self._row(entry) for entry in logger._iter_logs()),
+                )
+            # 1: written before the aggregates table existed
+            if schema_version < 2:
+                self._rebuild_aggregates()
+                self._conn.execute("PRAGMA user_version = 2")
+
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> tuple:
+        data = entry.get("data") or {}
+        return (
+            entry.get("timestamp"),
+            entry.get("session_id"),
+            entry.get("log_type"),
+            data.get("platform", "unknown"),
+            data.get("content_type", "unknown"),
+            data.get("latency"),
+            data.get("token_usage"),
+        )
+
+    @staticmethod
+    def _aggregate(rows: List[tuple]) -> List[tuple]:
+        """Fold index rows into (kind, key, n, total, first, last) increments for the aggregates table"""
+        deltas: Dict[tuple, list] = {}
+
+        def bump(kind: str, key: str, value: float = 0.0, timestamp: Optional[str] = None) -> None:
+            delta = deltas.setdefault((kind, key), [0, 0.0, timestamp, timestamp])
+            delta[0] += 1
+            delta[1] += value
+            if timestamp is not None:
+                delta[2] = min(delta[2], timestamp)
+                delta[3] = max(delta[3], timestamp)
+
+        for timestamp, _, log_type, platform, content_type, latency, token_usage in rows:
+            bump("log_type", log_type or "", timestamp=timestamp or "")
+            if log_type == "content_creation":
+                bump("platform", platform or "unknown")
+                bump("content_type", content_type or "unknown")
+                if latency is not None:
+                    bump("latency", "", latency)
+                if token_usage is not None:
+                    bump("token_usage", "", token_usage)
+        return [(kind, key, *delta) for (kind, key), delta in deltas.items()]
+
+    def _rebuild_aggregates(self) -> None:
+        """Recompute the aggregates table from the rows (new schema, or rows were deleted)"""
+        self._conn.execute("DELETE FROM aggregates")
+        self._conn.executemany(
+            "INSERT INTO aggregates VALUES (?, ?, ?, ?, ?, ?)",
+            self._aggregate(self._conn.execute("SELECT * FROM logs").fetchall()),
+        )
+
+    def add(self, entries: List[Dict[str, Any]]) -> None:
+        rows = [self._row(entry) for entry in entries]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.executemany(
+                "INSERT INTO aggregates VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (kind, key) DO UPDATE SET "
+                "n = n + excluded.n, total = total + excluded.total, "
+                "first = min(coalesce(first, excluded.first), coalesce(excluded.first, first)), "
+                "last = max(coalesce(last, excluded.last), coalesce(excluded.last, last))",
+                self._aggregate(rows),
+            )
+            self._generation += 1
+
+    def aggregates(self) -> List[tuple]:
+        return self.query("SELECT kind, key, n, total, first, last FROM aggregates")
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM logs")
+            self._conn.execute("DELETE FROM aggregates")
+            self._generation += 1
+
+    def trim(self, before: str, after: Optional[str] = None) -> None:
+        """
+        Drop rows for entries whose files were deleted
+        
+        Args:
+            before: Rows with an older timestamp are dropped
+            after: If given, only rows at or after this timestamp (or day) are dropped
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM logs WHERE timestamp < ? AND timestamp >= ?", (before, after or "")
+            )
+            self._rebuild_aggregates()
+            self._generation += 1
+
+    def data_version(self) -> int:
+        """SQLite's data_version: changes when another connection (process) commits, never for this one's writes"""
+        return self.query("PRAGMA data_version")[0][0]
+
+    def version(self) -> tuple:
+        """Generation plus (mtime_ns, size) of the database and its WAL; changes with every commit"""
+        stats = [self._generation]
+        for path in (self.path, f"{self.path}-wal"):
+            try:
+                st = os.stat(path)
+                stats.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stats.append(None)
+        return tuple(stats)
+
+    def session_buckets(self, session_id: str) -> List[str]:
+        """Day buckets holding entries from one session, so reads skip every other day"""
+        return [row[0] for row in self.query(
+            "SELECT DISTINCT substr(timestamp, 1, 10) FROM logs WHERE session_id = ?", (session_id,)
+        )]
+
+    def query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+# log_dir -> (index version, result); analytics is read far more often than the log changes
+_ANALYTICS_CACHE: Dict[str, tuple] = {}
+
+_INDEXES: Dict[str, _LogIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+def _get_index(logger: "ContentCreatorLogger") -> _LogIndex:
+    index = _INDEXES.get(logger.log_dir)
+    if index is None:
+        with _INDEXES_LOCK:
+            index = _INDEXES.get(logger.log_dir)
+            if index is None:
+                index = _INDEXES[logger.log_dir] = _LogIndex(logger)
+    return index
+
+def _format_errors(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Render exception objects as tracebacks; done at write time to keep it off the caller's path"""
+    if not any(isinstance(value, BaseException) for value in data.values()):
+        return data
+    return {
+        key: "".join(traceback.format_exception(type(value), value, value.__traceback__))
+        if isinstance(value, BaseException) else value
+        for key, value in data.items()
+    }
+
+# One id per process, so every entry from a run can be grouped and filtered together
+_SESSION_ID = uuid.uuid4().hex[:8]
+
 class ContentCreatorLogger:
     """Logger specifically for Content Creator Agent operations"""
     
-    def __init__(self, log_file: str = "content_creator_logs.json"):
+    def __init__(self, log_file: str = "content_creator_logs.jsonl"):
         self.log_file = log_file
-        self.session_id = str(uuid.uuid4())[:8]  # Unique session identifier
-        
-        # Create logs directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
-        self.log_path = os.path.join("logs", log_file)
+        self.session_id = _SESSION_ID  # Shared by every logger in the process
         
-        # Initialize log file if it doesn't exist
-        if not os.path.exists(self.log_path):
-            with open(self.log_path, 'w') as f:
-                json.dump([], f)
+        # content_creator_logs.jsonl -> logs/content_creator_logs/YYYY-MM-DD.jsonl
+        self.log_dir = os.path.join("logs", os.path.splitext(log_file)[0])
+        os.makedirs(self.log_dir, exist_ok=True)
+
+    @classmethod
+    def for_directory(cls, log_dir: str) -> "ContentCreatorLogger":
+        """Logger over an existing bucket directory anywhere on disk (used by migrate_logs)"""
+        logger = cls.__new__(cls)
+        logger.log_file = f"{os.path.basename(log_dir)}.jsonl"
+        logger.session_id = _SESSION_ID
+        logger.log_dir = log_dir
+        return logger
     
     @staticmethod
     def log_content_creation(run_data: Dict[str, Any]) -> None:
@@ -33,7 +506,7 @@ class ContentCreatorLogger:
         Args:
             run_data: Dictionary containing run information
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         logger._write_log(run_data, log_type="content_creation")
     
     @staticmethod 
@@ -44,7 +517,7 @@ class ContentCreatorLogger:
         Args:
             research_data: Dictionary containing research information
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         logger._write_log(research_data, log_type="research")
     
     @staticmethod
@@ -55,7 +528,7 @@ class ContentCreatorLogger:
         Args:
             tool_data: Dictionary containing tool usage information
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         logger._write_log(tool_data, log_type="tool_usage")
     
     @staticmethod
@@ -66,7 +539,7 @@ class ContentCreatorLogger:
         Args:
             error_data: Dictionary containing error information
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         logger._write_log(error_data, log_type="error")
     
     @staticmethod
@@ -77,7 +550,7 @@ class ContentCreatorLogger:
         Args:
             metrics_data: Dictionary containing performance metrics
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         logger._write_log(metrics_data, log_type="performance")
 
     @staticmethod
@@ -88,9 +561,20 @@ class ContentCreatorLogger:
         Args:
             run_data: Dictionary containing run information
         """
-        logger = ContentCreatorLogger("reddit_agent_logs.json")
+        logger = _get_logger("reddit_agent_logs.jsonl")
         logger._write_log(run_data, log_type="reddit_agent_run")
-    
+
+    @staticmethod
+    def log_reddit_error(error_data: Dict[str, Any]) -> None:
+        """
+        Log Reddit Agent errors that happen outside a run (e.g. background work)
+        
+        Args:
+            error_data: Dictionary containing error information
+        """
+        logger = _get_logger("reddit_agent_logs.jsonl")
+        logger._write_log(error_data, log_type="error")
+
     def _write_log(self, data: Dict[str, Any], log_type: str) -> None:
         """
         Write log entry to file
@@ -99,30 +583,183 @@ class ContentCreatorLogger:
             data: Data to log
             log_type: Type of log entry
         """
-        try:
-            # Load existing logs
-            with open(self.log_path, 'r') as f:
-                logs = json.load(f)
-            
-            # Create log entry
-            log_entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+        self._write_logs([data], log_type)
+
+    def _write_logs(self, entries: List[Dict[str, Any]], log_type: str) -> None:
+        """
+        Queue one or more log entries for the background writer
+        
+        Args:
+            entries: Data to log, one item per log entry
+            log_type: Type of log entries
+        """
+        # Stamped now so the time reflects the event, not when the writer got to it
+        timestamp = datetime.now(timezone.utc).isoformat()
+        _enqueue([
+            (self, {
+                "timestamp": timestamp,
                 "session_id": self.session_id,
                 "log_type": log_type,
                 "data": data
-            }
-            
-            # Add log entry
-            logs.append(log_entry)
+            })
+            for data in entries
+        ])
+
+    def _append(self, log_entries: List[Dict[str, Any]]) -> None:
+        """
+        Write entries to their day buckets, the index and the recent buffer (background thread)
+        
+        Args:
+            log_entries: Complete log entries, in the order they were logged
+        """
+        try:
+            for entry in log_entries:
+                entry["data"] = _format_errors(entry["data"])
+            buckets: Dict[str, List[bytes]] = {}
+            for entry in log_entries:
+                buckets.setdefault(entry["timestamp"][:10], []).append(_dumps(entry))
             
-            # Write back to file
-            with open(self.log_path, 'w') as f:
-                json.dump(logs, f, indent=2, default=str)
+            # Open the index first: a new index backfills from the buckets, which must not yet hold these entries
+            index = _get_index(self)
+            prune = False
+            # Held across file, index and buffer so a concurrent reseed of the buffer sees all of this batch or none
+            with _RECENT_LOCK:
+                for bucket, lines in buckets.items():
+                    # The shared writer buffers and rotates
+                    writer = _get_writer(self._bucket_path(bucket))
+                    writer.write(lines)
+                    # On disk before the index commit, so a process that sees the commit can read the lines
+                    writer.flush()
+                    if writer.needs_retention:
+                        writer.needs_retention = False
+                        prune = True
+                index.add(log_entries)
+                recent = _RECENT.get(self.log_dir)
+                if recent is not None:
+                    recent.add(log_entries)
+            if prune:
+                _enforce_retention(self.log_dir)
                 
         except Exception as e:
             # Fallback logging to console if file logging fails
             print(f"Logging error: {str(e)}")
-            print(f"Failed to log: {json.dumps(data, default=str)}")
+            print(f"Failed to log: {json.dumps(log_entries, default=str)}")
+
+    def _bucket_path(self, bucket: str) -> str:
+        return os.path.join(self.log_dir, f"{bucket}.jsonl")
+
+    def _buckets(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        days: Optional[Collection[str]] = None
+    ) -> List[str]:
+        """
+        Day buckets (YYYY-MM-DD) that can hold entries in [start_date, end_date], oldest first
+        
+        Args:
+            start_date: ISO timestamp or date; earlier buckets are skipped
+            end_date: ISO timestamp or date; later buckets are skipped
+            days: If given, only these buckets are considered
+        """
+        if not os.path.isdir(self.log_dir):
+            return []
+        # Bucket keys and ISO timestamps share a prefix, so plain string comparison prunes by date
+        buckets = {name[:10] for name in os.listdir(self.log_dir) if name[10:16] == ".jsonl"}
+        return sorted(
+            bucket for bucket in buckets
+            if (days is None or bucket in days)
+            and (not start_date or bucket >= start_date[:10]) and (not end_date or bucket <= end_date[:10])
+        )
+
+    def _bucket_files(self, bucket: str) -> List[str]:
+        """The bucket's file and its rotated parts, oldest first"""
+        path = self._bucket_path(bucket)
+        rotated = [f"{path}.{i}" for i in range(_BACKUP_COUNT, 0, -1)]
+        return [file for file in rotated + [path] if os.path.exists(file)]
+
+    def _iter_logs(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        days: Optional[Collection[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries from the day buckets in range, oldest first, one line at a time
+        
+        Args:
+            start_date: Skip buckets before this date
+            end_date: Skip buckets after this date
+            days: If given, only read these buckets
+            
+        Yields:
+            Log entries; lines that fail to parse are skipped
+        """
+        _flush_all()
+        for bucket in self._buckets(start_date, end_date, days):
+            for path in self._bucket_files(bucket):
+                with open(path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    for line in f:
+                        entry = self._parse_line(line)
+                        if entry is not None:
+                            yield entry
+
+    def _read_logs_reversed(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        days: Optional[Collection[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield entries from the day buckets in range, newest first
+        
+        Args:
+            start_date: Skip buckets before this date
+            end_date: Skip buckets after this date
+            days: If given, only read these buckets
+        """
+        _flush_all()
+        for bucket in reversed(self._buckets(start_date, end_date, days)):
+            for path in reversed(self._bucket_files(bucket)):
+                yield from self._read_file_reversed(path)
+
+    @classmethod
+    def _read_file_reversed(cls, path: str, chunk_size: int = _IO_BUFFER_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Yield entries from the end of one file backwards, reading fixed-size
+        chunks from EOF so only the tail is touched
+        
+        Args:
+            path: JSONL file to read
+            chunk_size: Bytes read per seek
+        """
+        with open(path, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0:
+                step = min(chunk_size, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + remainder).split(b"\n")
+                # The first piece may be the end of a line that started in an earlier chunk
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    entry = cls._parse_line(line)
+                    if entry is not None:
+                        yield entry
+            entry = cls._parse_line(remainder)
+            if entry is not None:
+                yield entry
+
+    @staticmethod
+    def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+        """Parse one JSONL line; blank or torn lines give None"""
+        if not line.strip():
+            return None
+        try:
+            return _loads(line)
+        except ValueError:
+            return None
     
     @staticmethod
     def get_logs(
@@ -145,36 +782,13 @@ class ContentCreatorLogger:
         Returns:
             List of log entries matching filters
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         
         try:
-            with open(logger.log_path, 'r') as f:
-                logs = json.load(f)
-            
-            # Apply filters
-            filtered_logs = logs
-            
-            if log_type:
-                filtered_logs = [log for log in filtered_logs if log.get("log_type") == log_type]
-            
-            if session_id:
-                filtered_logs = [log for log in filtered_logs if log.get("session_id") == session_id]
-            
-            if start_date:
-                filtered_logs = [log for log in filtered_logs if log.get("timestamp", "") >= start_date]
-            
-            if end_date:
-                filtered_logs = [log for log in filtered_logs if log.get("timestamp", "") <= end_date]
-            
-            # Sort by timestamp (newest first)
-            filtered_logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            
-            # Apply limit
-            if limit:
-                filtered_logs = filtered_logs[:limit]
-            
-            return filtered_logs
-            
+            _wait_for_queue()
+            version = _get_index(logger).version()
+            # The cached tuple shares its entries with the recent buffer; callers get copies
+            return _copy(_query_logs(logger.log_file, version, log_type, session_id, limit, start_date, end_date))
         except Exception as e:
             print(f"Error retrieving logs: {str(e)}")
             return []
@@ -187,52 +801,47 @@ class ContentCreatorLogger:
         Returns:
             Dictionary containing analytics data
         """
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         
         try:
-            with open(logger.log_path, 'r') as f:
-                logs = json.load(f)
-            
-            if not logs:
-                return {"message": "No logs found"}
+            _wait_for_queue()
+            index = _get_index(logger)
+            version = index.version()
+            cached = _ANALYTICS_CACHE.get(logger.log_dir)
+            if cached is not None and cached[0] == version:
+                return _copy(cached[1])
             
-            # Basic stats
-            total_runs = len([log for log in logs if log.get("log_type") == "content_creation"])
-            total_research_calls = len([log for log in logs if log.get("log_type") == "research"])
-            total_errors = len([log for log in logs if log.get("log_type") == "error"])
-            
-            # Platform distribution
+            # Running totals kept by the index on every write; no per-entry rows are read
+            type_counts = {}
             platforms = {}
             content_types = {}
+            sums = {"latency": (0, 0.0), "token_usage": (0, 0.0)}
+            first_log = last_log = None
+            for kind, key, count, total, first, last in index.aggregates():
+                if kind == "log_type":
+                    type_counts[key] = count
+                    first_log = first if first_log is None else min(first_log, first)
+                    last_log = last if last_log is None else max(last_log, last)
+                elif kind == "platform":
+                    platforms[key] = count
+                elif kind == "content_type":
+                    content_types[key] = count
+                else:
+                    sums[kind] = (count, total)
             
-            for log in logs:
-                if log.get("log_type") == "content_creation":
-                    data = log.get("data", {})
-                    
-                    # Platform stats
-                    platform = data.get("platform", "unknown")
-                    platforms[platform] = platforms.get(platform, 0) + 1
-                    
-                    # Content type stats
-                    content_type = data.get("content_type", "unknown")
-                    content_types[content_type] = content_types.get(content_type, 0) + 1
-            
-            # Performance stats
-            latencies = []
-            token_usage = []
+            if not type_counts:
+                return {"message": "No logs found"}
             
-            for log in logs:
-                if log.get("log_type") == "content_creation":
-                    data = log.get("data", {})
-                    if "latency" in data:
-                        latencies.append(data["latency"])
-                    if "token_usage" in data:
-                        token_usage.append(data["token_usage"])
+            total_runs = type_counts.get("content_creation", 0)
+            total_research_calls = type_counts.get("research", 0)
+            total_errors = type_counts.get("error", 0)
             
-            avg_latency = sum(latencies) / len(latencies) if latencies else 0
-            avg_tokens = sum(token_usage) / len(token_usage) if token_usage else 0
+            latency_count, latency_sum = sums["latency"]
+            token_count, token_sum = sums["token_usage"]
+            avg_latency = latency_sum / latency_count if latency_count else 0
+            avg_tokens = token_sum / token_count if token_count else 0
             
-            return {
+            analytics = {
                 "summary": {
                     "total_content_created": total_runs,
                     "total_research_calls": total_research_calls,
@@ -247,10 +856,12 @@ class ContentCreatorLogger:
                     "total_runs": total_runs
                 },
                 "date_range": {
-                    "first_log": logs[0].get("timestamp") if logs else None,
-                    "last_log": logs[-1].get("timestamp") if logs else None
+                    "first_log": first_log,
+                    "last_log": last_log
                 }
             }
+            _ANALYTICS_CACHE[logger.log_dir] = (version, analytics)
+            return _copy(analytics)
             
         except Exception as e:
             return {"error": f"Error generating analytics: {str(e)}"}
@@ -269,17 +880,97 @@ class ContentCreatorLogger:
         if not confirm:
             return False
         
-        logger = ContentCreatorLogger()
+        logger = _get_logger()
         
         try:
-            with open(logger.log_path, 'w') as f:
-                json.dump([], f)
+            _wait_for_queue()
+            _close_writers(logger.log_dir)
+            for bucket in logger._buckets():
+                for path in logger._bucket_files(bucket):
+                    os.remove(path)
+            _RECENT.pop(logger.log_dir, None)
+            _get_index(logger).clear()
             return True
         except Exception as e:
             print(f"Error clearing logs: {str(e)}")
             return False
 
 
+# One logger per log file, shared by the static logging methods
+_LOGGER_CACHE: Dict[str, ContentCreatorLogger] = {}
+_LOGGER_CACHE_LOCK = threading.Lock()
+
+def _get_logger(log_file: str = "content_creator_logs.jsonl") -> ContentCreatorLogger:
+    logger = _LOGGER_CACHE.get(log_file)
+    if logger is None:
+        with _LOGGER_CACHE_LOCK:
+            logger = _LOGGER_CACHE.get(log_file)
+            if logger is None:
+                logger = _LOGGER_CACHE[log_file] = ContentCreatorLogger(log_file)
+    return logger
+
+def _timestamp(log: Dict[str, Any]) -> str:
+    return log.get("timestamp", "")
+
+@functools.lru_cache(maxsize=64)
+def _query_logs(
+    log_file: str,
+    version: tuple,
+    log_type: Optional[str],
+    session_id: Optional[str],
+    limit: Optional[int],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> tuple:
+    """
+    get_logs body; version (the log index's) is part of the key, so a write from this
+    or another process misses the cache, and _get_recent then reseeds the recent
+    buffer if the write came from another process
+    """
+    logger = _get_logger(log_file)
+    
+    # One predicate, applied in a single pass over whichever source answers the query
+    def matches(log: Dict[str, Any]) -> bool:
+        timestamp = log.get("timestamp", "")
+        return (
+            (not log_type or log.get("log_type") == log_type)
+            and (not session_id or log.get("session_id") == session_id)
+            and (not start_date or timestamp >= start_date)
+            and (not end_date or timestamp <= end_date)
+        )
+    
+    recent = _get_recent(logger).query(start_date, end_date)
+    if recent is not None:
+        # Served from memory: already in range and newest first
+        filtered_logs = []
+        for log in recent:
+            if matches(log):
+                filtered_logs.append(log)
+                if len(filtered_logs) == limit:
+                    break
+        return tuple(filtered_logs)
+    
+    # The index knows which days a session wrote to; only those buckets need reading
+    days = _get_index(logger).session_buckets(session_id) if session_id else None
+    
+    if limit:
+        # The file is append-only, so the newest matches are at the end:
+        # read backwards and stop once enough are found
+        filtered_logs = []
+        for log in logger._read_logs_reversed(start_date, end_date, days):
+            if matches(log):
+                filtered_logs.append(log)
+                if len(filtered_logs) == limit:
+                    break
+    else:
+        filtered_logs = [log for log in logger._iter_logs(start_date, end_date, days) if matches(log)]
+    
+    # Newest first; with a limit only the top entries need ordering
+    if limit:
+        return tuple(heapq.nlargest(limit, filtered_logs, key=_timestamp))
+    filtered_logs.sort(key=_timestamp, reverse=True)
+    return tuple(filtered_logs)
+
 # Helper functions for easier logging
 def log_content_run(
     user_message: str,
@@ -325,4 +1016,24 @@ def log_research_request(topic: str, platform_focus: str, results: str, latency:
         "success": results is not None
     }
     
-    ContentCreatorLogger.log_research_call(research_data)
\ No newline at end of file
+    ContentCreatorLogger.log_research_call(research_data)
+
+
+def dump_pretty(path: str, out_path: Optional[str] = None) -> str:
+    """
+    Write an indented JSON copy of a JSONL log file for reading by hand;
+    the logs themselves stay compact
+    
+    Args:
+        path: A log file, e.g. logs/content_creator_logs/2025-01-31.jsonl
+        out_path: Where to write the copy (defaults to path + ".pretty.json")
+        
+    Returns:
+        The path written
+    """
+    out_path = out_path or f"{path}.pretty.json"
+    with open(path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        entries = [entry for entry in map(ContentCreatorLogger._parse_line, f) if entry is not None]
+    with open(out_path, 'w') as f:
+        json.dump(entries, f, indent=2, default=str)
+    return out_path
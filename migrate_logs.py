@@ -0,0 +1,78 @@
+"""
+One-shot migration of older log files in logs/ to per-day JSON Lines buckets
+(logs/<name>/YYYY-MM-DD.jsonl). Handles both the original JSON-array files
+and single-file .jsonl logs. Run once after upgrading: python migrate_logs.py
+"""
+
+import glob
+import os
+from collections import defaultdict
+
+from content_logger import ContentCreatorLogger, _LogIndex, _dumps, _loads
+
+def _read_entries(path: str) -> list:
+    with open(path, "rb") as f:
+        if path.endswith(".jsonl"):
+            return [_loads(line) for line in f if line.strip()]
+        entries = _loads(f.read())
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} is not a JSON array log")
+    return entries
+
+def migrate_log_file(path: str) -> int:
+    """
+    Split one log file into day buckets next to it
+
+    Migrated entries go before anything already logged to the same bucket
+    and into the directory's SQLite index if it exists (a new index backfills
+    from the buckets), and the old file is renamed to *.migrated.
+
+    Args:
+        path: Path to a logs/*.json or logs/*.jsonl file
+
+    Returns:
+        Number of entries migrated
+    """
+    entries = _read_entries(path)
+    log_dir = os.path.splitext(path)[0]
+    os.makedirs(log_dir, exist_ok=True)
+    # Checked before writing: an index created afterwards backfills these entries itself
+    indexed = os.path.exists(os.path.join(log_dir, "index.sqlite3"))
+
+    buckets = defaultdict(list)
+    for entry in entries:
+        buckets[str(entry.get("timestamp", ""))[:10] or "0000-00-00"].append(entry)
+
+    for bucket, bucket_entries in buckets.items():
+        bucket_path = os.path.join(log_dir, f"{bucket}.jsonl")
+        existing = b""
+        if os.path.exists(bucket_path):
+            with open(bucket_path, "rb") as f:
+                existing = f.read()
+
+        temp_path = bucket_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.writelines(_dumps(entry) for entry in bucket_entries)
+            f.write(existing)
+        os.replace(temp_path, bucket_path)
+
+    if indexed:
+        # An existing index never backfills again, so analytics would miss this history
+        index = _LogIndex(ContentCreatorLogger.for_directory(log_dir))
+        try:
+            index.add(entries)
+        finally:
+            index.close()
+    os.rename(path, path + ".migrated")
+    return len(entries)
+
+if __name__ == "__main__":
+    paths = sorted(glob.glob(os.path.join("logs", "*.json")) + glob.glob(os.path.join("logs", "*.jsonl")))
+    if not paths:
+        print("No log files to migrate")
+    for path in paths:
+        try:
+            count = migrate_log_file(path)
+            print(f"✅ {path}: {count} entries -> {os.path.splitext(path)[0]}/")
+        except Exception as e:
+            print(f"❌ {path}: {str(e)}")
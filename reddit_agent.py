@@ -1,28 +1,123 @@
 import os
 from dotenv import load_dotenv
 from typing import TypedDict, Annotated, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import json
+import re
+import threading
 import time
-import traceback
 
-from langchain_core.messages import AnyMessage, SystemMessage, HumanMessage, ToolMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-from langgraph.graph import START, StateGraph
-from langgraph.prebuilt import tools_condition
-from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode
-
-from tools import search_subreddits, search_subreddit_content, google_grounding_search, get_current_date
+# LangChain, LangGraph, Gemini and the tool modules are imported where they are
+# used, so `import reddit_agent` stays cheap for processes that never chat.
 from config import get_reddit_agent_config, get_shared_config
 from content_logger import ContentCreatorLogger
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for serializing tool results
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+# Messages answered by the fast-path model without running the research graph
+SIMPLE_MESSAGES = {
+    "hi", "hello", "hey", "yo", "thanks", "thank you", "thx", "ty", "ok", "okay",
+    "cool", "great", "nice", "bye", "goodbye", "good morning", "good night",
+}
+
+# Formatted UTC timestamp shared by all agents, rebuilt at most once per minute
+_last_ts = [0, ""]
+_last_ts_lock = threading.Lock()
+
+# Models whose connection has been prewarmed in this process; later agents skip the warm-up
+_prewarmed_models = set()
+_prewarm_lock = threading.Lock()
+
+def _current_date() -> str:
+    """Minute-granularity ISO timestamp; byte-identical within a minute so prompts stay cacheable"""
+    minute = int(time.time()) // 60
+    with _last_ts_lock:
+        if minute != _last_ts[0]:
+            _last_ts[:] = [minute, datetime.fromtimestamp(minute * 60, timezone.utc).isoformat()]
+        return _last_ts[1]
+
+def _tool_content(output) -> str:
+    """Tool result as ToolMessage text; non-ASCII stays literal so snippets cost fewer tokens"""
+    if isinstance(output, str):
+        return output
+    if orjson is not None:
+        return orjson.dumps(output, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(output, default=str, ensure_ascii=False, separators=(",", ":"))
+
+def _text(content) -> str:
+    """Message content as plain text; Gemini may return a list of str/{"type": "text"} parts"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in content
+            if isinstance(part, str) or (isinstance(part, dict) and part.get("type") == "text")
+        )
+    return ""
+
+# Messages containing these words ask for fresh data and bypass the response cache
+STALE_SENSITIVE_PATTERN = re.compile(r"\b(today|now|latest|current|breaking)\b", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=None)
+def _tool_call_recorder_class():
+    """Build ToolCallRecorder on first use so its LangChain base class is imported lazily"""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class ToolCallRecorder(BaseCallbackHandler):
+        """Collects each tool call for the run log as it finishes, instead of rescanning messages"""
+
+        def __init__(self):
+            self.captured: List[dict] = []
+            self._started: dict = {}
+
+        def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs):
+            self._started[run_id] = {
+                "tool_name": (serialized or {}).get("name"),
+                "tool_call_id": (metadata or {}).get("tool_call_id"),
+            }
+
+        def on_tool_end(self, output, *, run_id, **kwargs):
+            self._capture(run_id, output)
+
+        def on_tool_error(self, error, *, run_id, **kwargs):
+            self._capture(run_id, f"Error: {str(error)}")
+
+        def _capture(self, run_id, content):
+            call = self._started.pop(run_id, {})
+            self.captured.append({
+                "tool_name": call.get("tool_name"),
+                "tool_call_id": call.get("tool_call_id"),
+                "content": content,
+                "id": str(run_id)
+            })
+
+    return ToolCallRecorder
+
+def __getattr__(name):
+    """PEP 562: resolve LangChain-backed module attributes lazily"""
+    if name == "ToolCallRecorder":
+        return _tool_call_recorder_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 class RedditAgent:
     def __init__(self):
         """Initialize agent with Gemini and tools from config"""
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from tools import (
+            search_subreddits, search_subreddit_content, search_subreddits_content,
+            search_subreddit_content_archive, google_grounding_search, get_current_date
+        )
         
         # Load configuration
         self.config = get_reddit_agent_config()
@@ -38,9 +133,23 @@ class RedditAgent:
             if not os.getenv(var):
                 raise ValueError(f"{var} environment variable not set")
 
-        # Initialize memory with system message from config
+        # Initialize memory: the system message is rebuilt per call and kept
+        # apart from the rolling window; only the last K turns are resent.
         self.system_message = self.config["system_prompt"]
-        self.memory: List[AnyMessage] = [SystemMessage(content=self.system_message)]
+        context_window_k = self.config.get("context_window_k", 10)
+        self.memory: deque = deque(maxlen=2 * context_window_k)
+        # Rolling summary of turns that have fallen out of the window
+        self.summary: str = ""
+        self._evicted: List = []
+        self._summary_lock = threading.Lock()  # guards _evicted and _summarizing
+        self._summarizing = False
+
+        # Short-lived cache of answers keyed on the message and the turn before it
+        cache_config = self.config.get("response_cache", {})
+        self._response_cache = None
+        if cache_config.get("enabled"):
+            from cachetools import TTLCache
+            self._response_cache = TTLCache(maxsize=cache_config.get("maxsize", 256), ttl=cache_config.get("ttl", 300))
 
         # Initialize LLM with config settings
         model_config = self.config["model"]
@@ -55,12 +164,36 @@ class RedditAgent:
             llm_kwargs["max_tokens"] = model_config["max_tokens"]
         if model_config.get("top_p"):
             llm_kwargs["top_p"] = model_config["top_p"]
+        # A Gemini context cache already holds the static system prompt and
+        # tool declarations, so repeat turns are only billed for the delta.
+        self.cached_content = model_config.get("cached_content")
+        if self.cached_content:
+            llm_kwargs["cached_content"] = self.cached_content
             
         self.llm = ChatGoogleGenerativeAI(**llm_kwargs)
+        # Cheaper, faster model for small talk that needs no tools
+        self.llm_lite = ChatGoogleGenerativeAI(
+            model=self.config["fast_path_model"],
+            temperature=model_config["temperature"],
+            api_key=self.api_key,
+        )
 
-        self.tools = [search_subreddits, search_subreddit_content, google_grounding_search, get_current_date]
-        self.chat_with_tools = self.llm.bind_tools(self.tools)
+        self.tools = [
+            search_subreddits, search_subreddit_content, search_subreddits_content,
+            search_subreddit_content_archive, google_grounding_search, get_current_date
+        ]
+        self.tools_by_name = {t.name: t for t in self.tools}
+        # Gemini rejects tools on requests that use cached content; they are served from the cache
+        self.chat_with_tools = self.llm if self.cached_content else self.llm.bind_tools(self.tools)
         self.agent = self._build_agent()
+
+        # Open the Gemini connection (DNS, TLS, auth) off the critical path
+        if model_config.get("prewarm_connection", True):
+            with _prewarm_lock:
+                first = model_config["name"] not in _prewarmed_models
+                _prewarmed_models.add(model_config["name"])
+            if first:
+                threading.Thread(target=self._prewarm_connection, name="gemini-prewarm", daemon=True).start()
         
         # Initialize logger
         if self.config["logging"]["enabled"]:
@@ -68,8 +201,23 @@ class RedditAgent:
             # This could be refactored to use the instance logger if desired
             self.logger = ContentCreatorLogger(self.config["logging"]["log_file"])
 
+    def _prewarm_connection(self):
+        """
+        Issue a free token-count request so the first chat() call reuses an
+        already-established client connection instead of paying the handshake.
+        """
+        try:
+            self.llm.get_num_tokens("ping")
+        except Exception:
+            # Warm-up is best effort; the first real call will connect normally
+            pass
+
     def _build_agent(self):
         """Build the LangGraph agent workflow"""
+        from langchain_core.messages import AnyMessage, SystemMessage
+        from langgraph.graph import START, StateGraph
+        from langgraph.graph.message import add_messages
+        from langgraph.prebuilt import tools_condition
 
         class AgentState(TypedDict):
             messages: Annotated[list[AnyMessage], add_messages]
@@ -78,9 +226,8 @@ class RedditAgent:
             """Main assistant node"""
             messages = state["messages"]
             
-            # Add system message if not already present
-            if not messages or not isinstance(messages[0], SystemMessage):
-                messages = [SystemMessage(content=self.system_message)] + messages
+            # chat_stream() always puts the system block first; stripped under -O
+            assert isinstance(messages[0], SystemMessage), "first message must be the system block"
             
             return {
                 "messages": [self.chat_with_tools.invoke(messages)],
@@ -91,10 +238,15 @@ class RedditAgent:
         
         # Define nodes
         builder.add_node("assistant", assistant)
-        builder.add_node("tools", ToolNode(self.tools))
+        builder.add_node("tools", self._run_tools)
         
-        # Define edges
-        builder.add_edge(START, "assistant")
+        # Define edges. _stream_agent makes the first model call itself, so a
+        # run that enters with pending tool calls starts at the tools node.
+        builder.add_conditional_edges(
+            START,
+            lambda state: "tools" if getattr(state["messages"][-1], "tool_calls", None) else "assistant",
+            ["assistant", "tools"],
+        )
         builder.add_conditional_edges(
             "assistant",
             tools_condition,
@@ -103,13 +255,163 @@ class RedditAgent:
         
         return builder.compile()
 
+    def _run_tools(self, state, config):
+        """
+        Execute all tool calls from the last assistant message concurrently.
+        Tools are I/O-bound, so a turn with N calls takes ~max latency instead of the sum.
+        """
+        from langchain_core.messages import ToolMessage
+
+        tool_calls = state["messages"][-1].tool_calls
+        limit = self.shared_config["rate_limits"].get("tool_concurrency_limit", 4)
+
+        def run_one(tool_call):
+            # Expose the call id to callbacks (see ToolCallRecorder)
+            metadata = {**(config.get("metadata") or {}), "tool_call_id": tool_call["id"]}
+            try:
+                output = self.tools_by_name[tool_call["name"]].invoke(tool_call["args"], {**config, "metadata": metadata})
+                return ToolMessage(content=_tool_content(output), name=tool_call["name"], tool_call_id=tool_call["id"])
+            except Exception as e:
+                # Errors stay isolated to the failing call's ToolMessage
+                return ToolMessage(
+                    content=f"Error: {str(e)}", name=tool_call["name"],
+                    tool_call_id=tool_call["id"], status="error"
+                )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(limit, len(tool_calls)))) as executor:
+            return {"messages": list(executor.map(run_one, tool_calls))}
+
+    def _is_simple_message(self, message: str) -> bool:
+        """Cheap check for greetings/acknowledgements that need no research"""
+        if "?" in message or len(message.split()) >= 4:
+            return False
+        return message.strip().lower().rstrip(".!") in SIMPLE_MESSAGES
+
+    def _stream_fast_path(self, human_message):
+        """Answer a simple message with the lightweight model; returns the full AI message"""
+        from langchain_core.messages import SystemMessage
+
+        messages = [SystemMessage(content=self.config["fast_path_system_prompt"]), human_message]
+        response = None
+        for chunk in self.llm_lite.stream(messages):
+            response = chunk if response is None else response + chunk
+            text = _text(chunk.content)
+            if text:
+                yield text
+        return response
+
+    def _stream_agent(self, messages, run_log):
+        """Run the tool-using graph, yielding answer text; returns the final AI message"""
+        # Fast path: the first model call runs outside the graph, and answers that
+        # need no tools return without any node dispatch or state updates
+        first = None
+        for chunk in self.chat_with_tools.stream(messages):
+            first = chunk if first is None else first + chunk
+            text = _text(chunk.content)
+            if text:
+                yield text
+        if not first.tool_calls:
+            return first
+
+        recorder = _tool_call_recorder_class()()
+        final_state = None
+        for mode, payload in self.agent.stream(
+            {"messages": [*messages, first]},
+            config={"callbacks": [recorder]},
+            stream_mode=["messages", "values"],
+        ):
+            if mode == "messages":
+                # Token chunks from the LLM; skip tool output and tool-call deltas
+                chunk, metadata = payload
+                text = _text(chunk.content) if metadata.get("langgraph_node") == "assistant" else ""
+                if text:
+                    yield text
+            else:
+                final_state = payload
+
+        run_log["tool_calls"] = recorder.captured
+        return final_state["messages"][-1]
+
+    def _response_cache_key(self, message: str):
+        """Cache key for a message in the current context, or None when it must not be cached"""
+        if self._response_cache is None:
+            return None
+        if STALE_SENSITIVE_PATTERN.search(message):
+            return None
+        context = "".join(f"{msg.type}:{msg.content}" for msg in list(self.memory)[-2:])
+        return hashlib.blake2b((message + context).encode(), digest_size=16).hexdigest()
+
+    def _remember(self, *messages):
+        """Append to the rolling window, folding evicted turns into the summary when enabled"""
+        summarization = self.config.get("summarization", {})
+        with self._summary_lock:
+            for msg in messages:
+                if summarization.get("enabled") and len(self.memory) == self.memory.maxlen:
+                    self._evicted.append(self.memory[0])
+                self.memory.append(msg)
+
+            if len(self._evicted) < summarization.get("batch_size", 4) or self._summarizing:
+                return
+            self._summarizing = True
+            batch = list(self._evicted)
+
+        # Off the response path: the stream finishes without waiting for the summary call.
+        # A daemon thread, like the prewarm, so exiting never waits on it either
+        threading.Thread(
+            target=self._update_summary, args=(batch, summarization.get("max_tokens", 200)),
+            name="memory-summary", daemon=True
+        ).start()
+
+    def _update_summary(self, batch: List, max_tokens: int):
+        """Fold a batch of evicted messages into self.summary with one LLM call (background thread)"""
+        from langchain_core.messages import SystemMessage, HumanMessage
+
+        transcript = "\n".join(f"{msg.type}: {msg.content}" for msg in batch)
+        prompt = [
+            SystemMessage(content=f"Summarize this conversation in under {max_tokens} tokens. Keep facts, names, sources and open questions."),
+            HumanMessage(content=f"Existing summary:\n{self.summary or '(none)'}\n\nNew messages:\n{transcript}"),
+        ]
+        try:
+            self.summary = _text(self.llm.invoke(prompt).content)
+        except Exception as e:
+            # The batch is dropped rather than retried, so repeated failures cannot grow the backlog
+            if self.config["logging"]["enabled"]:
+                ContentCreatorLogger.log_reddit_error({
+                    "error_type": "summary_update_error", "error": e, "evicted_messages": len(batch)
+                })
+        finally:
+            with self._summary_lock:
+                del self._evicted[:len(batch)]
+                self._summarizing = False
+
     def chat(self, message):
-        """Chat with the agent and log each run with metrics and tool calls."""
-        current_date = datetime.utcnow().isoformat()
+        """Chat with the agent and return the full response (joins chat_stream)."""
+        return "".join(self.chat_stream(message))
+
+    def chat_stream(self, message):
+        """
+        Chat with the agent, yielding response text as Gemini streams it.
+        Each run is logged with metrics and tool calls once the stream completes.
+        """
+        from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
+
+        current_date = _current_date()
         
-        self.memory.append(SystemMessage(content=f"Today's date is {current_date}"))
-        self.memory.append(HumanMessage(content=message))
-        start_time = time.time()
+        # A single system block carries the date; it is rebuilt, never stored.
+        # The static prompt always comes first so the request prefix is byte-identical
+        # across turns (Gemini implicit caching); with an explicit cache it is omitted.
+        date_line = f"Today's date is {current_date}"
+        if self.cached_content:
+            system_message = SystemMessage(content=date_line)
+        else:
+            system_message = SystemMessage(content=f"{self.system_message}\n\n{date_line}")
+        human_message = HumanMessage(content=message)
+        # Invariant relied on by the assistant node: the system block is always first
+        messages = [system_message]
+        if self.summary:
+            messages.append(SystemMessage(content=f"Prior context: {self.summary}"))
+        messages += [*self.memory, human_message]
+        start_time = time.monotonic()
         
         run_log = {
             "user_message": message,
@@ -121,40 +423,47 @@ class RedditAgent:
         }
         
         try:
-            result = self.agent.invoke({"messages": self.memory})
-            messages = result["messages"]
-            agent_response = messages[-1]
-            self.memory.append(agent_response)
+            cache_key = self._response_cache_key(message)
+            cached_response = self._response_cache.get(cache_key) if cache_key else None
+            if cached_response is not None:
+                # Exact repeat in the same context: no LLM or tool round trip
+                run_log["cache_hit"] = True
+                agent_response = AIMessage(content=cached_response)
+                if cached_response:
+                    yield cached_response
+            elif self._is_simple_message(message):
+                # Small talk skips the tool pipeline and the long research prompt
+                run_log["fast_path"] = True
+                agent_response = yield from self._stream_fast_path(human_message)
+            else:
+                agent_response = yield from self._stream_agent(messages, run_log)
 
-            # Extract ToolMessage objects and log them
-            for msg in messages:
-                if isinstance(msg, ToolMessage):
-                    run_log["tool_calls"].append({
-                        "tool_name": msg.name,
-                        "tool_call_id": getattr(msg, "tool_call_id", None),
-                        "content": msg.content,
-                        "id": getattr(msg, "id", None)
-                    })
+            # Only the user turn and final answer are kept; intermediate
+            # tool calls/results stay out of the rolling window.
+            self._remember(human_message, agent_response)
 
             # Extract token usage from Gemini usage_metadata if available
             usage_metadata = getattr(agent_response, "usage_metadata", None)
             if usage_metadata and "total_tokens" in usage_metadata:
                 run_log["token_usage"] = usage_metadata["total_tokens"]
             
-            run_log["agent_response"] = agent_response.content
+            run_log["agent_response"] = _text(agent_response.content)
             run_log["success"] = True
+            if cache_key and cached_response is None:
+                self._response_cache[cache_key] = run_log["agent_response"]
             
         except Exception as e:
-            run_log["error"] = traceback.format_exc()
+            # Keep the exception itself; the logger thread formats the traceback
+            run_log["error"] = e
             run_log["agent_response"] = f"[ERROR] {str(e)}"
+            yield run_log["agent_response"]
             
         finally:
-            run_log["latency"] = round(time.time() - start_time, 3)
+            run_log["latency"] = round(time.monotonic() - start_time, 3)
             if self.config["logging"]["enabled"]:
+                # Queued; content_logger writes it on its background thread
                 ContentCreatorLogger.log_reddit_run(run_log)
 
-        return run_log["agent_response"]
-
     def interactive_chat(self):
         """Start interactive chat session with memory"""
         print("🤖 Reddit Agent Ready!")
@@ -173,8 +482,10 @@ class RedditAgent:
                     break
                 if not user_input:
                     continue
-                response = self.chat(user_input)
-                print(f"Agent: {response}")
+                print("Agent: ", end="", flush=True)
+                for chunk in self.chat_stream(user_input):
+                    print(chunk, end="", flush=True)
+                print()
             except KeyboardInterrupt:
                 print("\nGoodbye!")
                 break
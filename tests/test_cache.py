@@ -0,0 +1,133 @@
+import threading
+import unittest
+from unittest import mock
+
+import cache
+from cache import SingleFlight, TTLCache
+
+
+class _Clock:
+    """Stands in for the time module so expiry can be stepped through deterministically"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(cache, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entry_is_fresh_then_stale_then_expired(self):
+        ttl_cache = TTLCache()
+        ttl_cache.set("k", "v", ttl=10, stale_ttl=20)
+
+        self.assertEqual(ttl_cache.get("k"), ("v", True))
+        self.clock.now += 15
+        self.assertEqual(ttl_cache.get("k"), ("v", False))
+        self.clock.now += 15
+        self.assertIsNone(ttl_cache.get("k"))
+        self.assertEqual(ttl_cache.stats, {"hits": 1, "stale_hits": 1, "misses": 1, "evictions": 0})
+
+    def test_no_stale_window_expires_at_ttl(self):
+        ttl_cache = TTLCache()
+        ttl_cache.set("k", "v", ttl=10)
+        self.clock.now += 10
+        self.assertIsNone(ttl_cache.get("k"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        ttl_cache = TTLCache(max_size=2)
+        ttl_cache.set("a", 1, ttl=60)
+        ttl_cache.set("b", 2, ttl=60)
+        ttl_cache.get("a")
+        ttl_cache.set("c", 3, ttl=60)
+
+        self.assertIsNone(ttl_cache.get("b"))
+        self.assertEqual(ttl_cache.get("a"), (1, True))
+        self.assertEqual(ttl_cache.stats["evictions"], 1)
+
+
+class _LookupCounter(dict):
+    """SingleFlight's in-flight map, counting lookups so a test knows every caller has joined"""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = threading.Semaphore(0)
+
+    def get(self, key, default=None):
+        self.lookups.release()
+        return super().get(key, default)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_calls_share_one_run(self):
+        flight = SingleFlight()
+        flight._inflight = _LookupCounter()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        # Once all four have looked up the key, three hold the leader's future
+        for _ in threads:
+            self.assertTrue(flight._inflight.lookups.acquire(timeout=5))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(dict(flight._inflight), {})
+
+    def test_exception_reaches_every_waiter_and_is_not_kept(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("upstream down")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("k", fail)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        flight._inflight = _LookupCounter()
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(5))
+        follower = threading.Thread(target=call)
+        follower.start()
+        for _ in range(2):
+            self.assertTrue(flight._inflight.lookups.acquire(timeout=5))
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(errors, ["upstream down"] * 2)
+        # A failed call is not cached; the next one runs again
+        self.assertEqual(flight.do("k", lambda: "ok"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
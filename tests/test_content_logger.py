@@ -0,0 +1,139 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import content_logger
+from content_logger import ContentCreatorLogger
+from migrate_logs import migrate_log_file
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _reset_logger_state():
+    """Drop the module's per-log caches, which are keyed by the (relative) log directory"""
+    content_logger._wait_for_queue()
+    content_logger._flush_all()
+    for path in list(content_logger._WRITERS):
+        content_logger._WRITERS.pop(path).close()
+    for index in content_logger._INDEXES.values():
+        index.close()
+    content_logger._INDEXES.clear()
+    content_logger._RECENT.clear()
+    content_logger._ANALYTICS_CACHE.clear()
+    content_logger._LOGGER_CACHE.clear()
+    content_logger._query_logs.cache_clear()
+
+
+class LoggerTestCase(unittest.TestCase):
+    """Runs each test in its own working directory, so logs/ starts empty"""
+
+    def setUp(self):
+        _reset_logger_state()
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        _reset_logger_state()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+class CrossProcessTest(LoggerTestCase):
+    def _log_from_other_process(self, name):
+        env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+        subprocess.run(
+            [sys.executable, "-c",
+             "from content_logger import ContentCreatorLogger\n"
+             f"ContentCreatorLogger.log_research_call({{'name': {name!r}}})"],
+            check=True, env=env,
+        )
+
+    def test_get_logs_sees_entries_written_by_another_process(self):
+        ContentCreatorLogger.log_research_call({"name": "a"})
+        # Seeds the recent buffer and caches the result for the current index version
+        self.assertEqual([log["data"]["name"] for log in ContentCreatorLogger.get_logs()], ["a"])
+
+        self._log_from_other_process("b")
+
+        self.assertEqual([log["data"]["name"] for log in ContentCreatorLogger.get_logs()], ["b", "a"])
+        self.assertEqual(ContentCreatorLogger.get_analytics()["summary"]["total_research_calls"], 2)
+
+    def test_own_writes_after_another_process_are_not_duplicated(self):
+        ContentCreatorLogger.log_research_call({"name": "a"})
+        ContentCreatorLogger.get_logs()
+        self._log_from_other_process("b")
+        ContentCreatorLogger.get_logs()
+        ContentCreatorLogger.log_research_call({"name": "c"})
+
+        self.assertEqual([log["data"]["name"] for log in ContentCreatorLogger.get_logs()], ["c", "b", "a"])
+
+
+class RetentionIndexTest(LoggerTestCase):
+    """Analytics (read from the index) must match what is left on disk after files are dropped"""
+
+    def _log(self, count):
+        for i in range(count):
+            ContentCreatorLogger.log_research_call({"i": i, "padding": "x" * 100})
+            content_logger._wait_for_queue()
+
+    def _assert_index_matches_disk(self):
+        on_disk = sum(1 for _ in content_logger._get_logger()._iter_logs())
+        analytics = ContentCreatorLogger.get_analytics()
+        self.assertEqual(analytics.get("summary", {}).get("total_research_calls", 0), on_disk)
+        return on_disk
+
+    def test_rotation_past_backup_count_trims_dropped_rows(self):
+        with mock.patch.object(content_logger, "_MAX_LOG_BYTES", 300), \
+                mock.patch.object(content_logger, "_BACKUP_COUNT", 1):
+            self._log(10)
+            on_disk = self._assert_index_matches_disk()
+        self.assertLess(on_disk, 10)
+
+    def test_retention_leaving_only_an_empty_live_file_trims_all_rows(self):
+        with mock.patch.object(content_logger, "_MAX_LOG_BYTES", 300), \
+                mock.patch.object(content_logger, "_MAX_LOG_DIR_BYTES", 1):
+            self._log(2)
+            on_disk = self._assert_index_matches_disk()
+        self.assertEqual(on_disk, 0)
+
+
+class CachedResultsTest(LoggerTestCase):
+    def test_mutating_returned_logs_does_not_change_later_reads(self):
+        ContentCreatorLogger.log_research_call({"i": 1})
+        ContentCreatorLogger.get_logs(limit=3)[0]["data"]["i"] = "X"
+        self.assertEqual(ContentCreatorLogger.get_logs(limit=3)[0]["data"]["i"], 1)
+
+    def test_mutating_returned_analytics_does_not_change_later_reads(self):
+        ContentCreatorLogger.log_research_call({"i": 1})
+        analytics = ContentCreatorLogger.get_analytics()
+        analytics["x"] = 1
+        analytics["summary"]["total_research_calls"] = 99
+        again = ContentCreatorLogger.get_analytics()
+        self.assertNotIn("x", again)
+        self.assertEqual(again["summary"]["total_research_calls"], 1)
+
+
+class MigrateLogsTest(LoggerTestCase):
+    def test_migrated_entries_reach_an_existing_index(self):
+        ContentCreatorLogger.log_research_call({"name": "new"})
+        self.assertEqual(ContentCreatorLogger.get_analytics()["summary"]["total_research_calls"], 1)
+
+        old_entry = {
+            "timestamp": "2024-01-01T00:00:00+00:00", "session_id": "old",
+            "log_type": "research", "data": {"name": "old"},
+        }
+        with open(os.path.join("logs", "content_creator_logs.json"), "w") as f:
+            json.dump([old_entry], f)
+        self.assertEqual(migrate_log_file(os.path.join("logs", "content_creator_logs.json")), 1)
+
+        self.assertEqual(ContentCreatorLogger.get_analytics()["summary"]["total_research_calls"], 2)
+        self.assertEqual([log["data"]["name"] for log in ContentCreatorLogger.get_logs()], ["new", "old"])
+
+
+if __name__ == "__main__":
+    unittest.main()
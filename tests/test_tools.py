@@ -0,0 +1,162 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import cache
+
+try:
+    import tools
+except ImportError:  # The tools module needs langchain_core and praw
+    tools = None
+
+
+class _Clock:
+    """Stands in for the time module: sleeps advance the clock instead of blocking"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@unittest.skipIf(tools is None, "tools requires langchain_core and praw")
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(tools, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_is_free_then_callers_wait_one_interval_each(self):
+        limiter = tools._RateLimiter(60, per=60.0, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+        limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_tokens_refill_with_elapsed_time_up_to_the_burst(self):
+        limiter = tools._RateLimiter(60, per=60.0, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now += 120
+        for _ in range(3):
+            limiter.acquire()
+        # Two minutes refill only the two-token burst; the third call waits
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_wait_past_max_wait_defers_without_taking_a_token(self):
+        limiter = tools._RateLimiter(60, per=60.0, burst=1, max_wait=0.5)
+        limiter.acquire()
+        with self.assertRaises(tools.RateLimitDeferred) as caught:
+            limiter.acquire()
+        self.assertEqual(caught.exception.wait, 1.0)
+
+        self.clock.now += 1
+        limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+
+@unittest.skipIf(tools is None, "tools requires langchain_core and praw")
+class CachedSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        for patcher in (
+            mock.patch.object(cache, "time", self.clock),
+            mock.patch.object(tools, "_TOOL_CACHE", cache.TTLCache()),
+            mock.patch.object(tools, "_REFRESH_POOL", self.pool),
+            mock.patch.object(tools, "_tool_disk_cache", return_value=None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.calls = []
+        # Held by a test to keep a background refresh from finishing
+        self.upstream = threading.Event()
+        self.upstream.set()
+
+        @tools._cached_search(ttl=10, stale_ttl=20)
+        def search(query, limit=5):
+            self.calls.append(query)
+            count = len(self.calls)
+            self.upstream.wait(5)
+            return f"{query}:{count}"
+
+        self.search = search
+
+    def test_default_arguments_share_an_entry(self):
+        self.assertEqual(self.search("ai"), "ai:1")
+        self.assertEqual(self.search("ai", limit=5), "ai:1")
+        self.assertEqual(self.calls, ["ai"])
+
+    def test_stale_entry_is_served_while_one_refresh_replaces_it(self):
+        self.search("ai")
+        self.clock.now += 15
+        self.upstream.clear()
+
+        self.assertEqual(self.search("ai"), "ai:1")
+        self.assertEqual(self.search("ai"), "ai:1")
+        self.upstream.set()
+        self.pool.shutdown(wait=True)
+
+        self.assertEqual(self.calls, ["ai", "ai"])
+        self.assertEqual(self.search("ai"), "ai:2")
+
+    def test_expired_entry_is_fetched_again(self):
+        self.search("ai")
+        self.clock.now += 30
+        self.assertEqual(self.search("ai"), "ai:2")
+
+    def test_error_results_are_not_cached(self):
+        @tools._cached_search(ttl=10)
+        def failing(query):
+            self.calls.append(query)
+            return "Error: upstream down"
+
+        failing("ai")
+        failing("ai")
+        self.assertEqual(self.calls, ["ai", "ai"])
+
+
+@unittest.skipIf(tools is None, "tools requires langchain_core and praw")
+class ParseBundleTest(unittest.TestCase):
+    def test_well_formed_response_is_split_into_sections(self):
+        text = (
+            "Here you go.\n"
+            "=== ARTICLE ===\nLong form body\n\n"
+            "=== X THREAD ===  \n1/ First post\n"
+            "=== ANALYSIS ===\nHooks work."
+        )
+        self.assertEqual(tools._parse_bundle(text), {
+            "article": "Long form body",
+            "x_thread": "1/ First post",
+            "analysis": "Hooks work.",
+        })
+
+    def test_missing_sections_come_back_empty(self):
+        bundle = tools._parse_bundle("=== ANALYSIS ===\nOnly analysis")
+        self.assertEqual(bundle, {"article": "", "x_thread": "", "analysis": "Only analysis"})
+
+    def test_markers_inside_a_line_are_not_section_breaks(self):
+        bundle = tools._parse_bundle("=== ARTICLE ===\nSee === X THREAD === below\n")
+        self.assertEqual(bundle["article"], "See === X THREAD === below")
+        self.assertEqual(bundle["x_thread"], "")
+
+    def test_response_without_markers_is_rejected(self):
+        with self.assertRaises(ValueError):
+            tools._parse_bundle("Sorry, I can't help with that.")
+
+
+if __name__ == "__main__":
+    unittest.main()
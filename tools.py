@@ -1,26 +1,225 @@
 from langchain_core.tools import tool
+import functools
+import heapq
+import inspect
+import operator
 import praw
 import os
-from datetime import datetime
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+from cache import DiskCache, SingleFlight, TTLCache
+
+# Reddit listings are plain HTTP round trips; independent ones run side by side here
+_REDDIT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="reddit-fetch")
+_REDDIT_PAGE_SIZE = 100  # Most items Reddit returns per listing request
+
+class RateLimitDeferred(Exception):
+    """Raised instead of sleeping when a Reddit request would have to wait longer than allowed"""
+
+    def __init__(self, wait: float):
+        super().__init__(f"Reddit rate limit reached; retry in {wait:.0f}s")
+        self.wait = wait
+
+class _RateLimiter:
+    """Token bucket shared by every Reddit request in the process; callers block until their slot"""
+
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 5, max_wait: Optional[float] = None):
+        self._interval = per / rate
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.max_wait = max_wait
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) / self._interval)
+            self._updated = now
+            wait = (1 - self._tokens) * self._interval if self._tokens < 1 else 0.0
+            # A deferred caller gives up its place rather than reserving a token
+            if self.max_wait is not None and wait > self.max_wait:
+                raise RateLimitDeferred(wait)
+            # Reserve a token even when none is left, so waiters are served in arrival order
+            self._tokens -= 1
+        if wait:
+            time.sleep(wait)
+
+@functools.lru_cache(maxsize=1)
+def _reddit_limiter() -> _RateLimiter:
+    from config import get_shared_config
+    rate_limits = get_shared_config()["rate_limits"]
+    return _RateLimiter(
+        rate_limits.get("reddit_requests_per_minute", 60),
+        max_wait=rate_limits.get("reddit_max_wait")
+    )
+
+def _fetch(listing) -> list:
+    """
+    Materialize a lazy PRAW listing (one GET) once the rate limiter allows it
+    
+    Raises:
+        RateLimitDeferred: When the local limiter or Reddit's own quota would block past reddit_max_wait
+    """
+    limiter = _reddit_limiter()
+    if limiter.max_wait is not None:
+        # PRAW sleeps inside the request until the reset once Reddit reports no requests left
+        limits = _reddit().auth.limits
+        if limits.get("remaining") is not None and limits["remaining"] < 1:
+            wait = limits["reset_timestamp"] - time.time()
+            if wait > limiter.max_wait:
+                raise RateLimitDeferred(wait)
+    limiter.acquire()
+    return list(listing)
+
+# --- Search result caching ---
+# Agents repeat the same searches within and across turns; identical calls within
+# the TTL are answered from memory. Past the TTL an entry is still served for a
+# stale window while one background refresh replaces it. Entries are also kept in
+# SQLite (shared config "tool_cache"), so a fresh process starts with a warm cache.
+_TOOL_CACHE = TTLCache(max_size=512)
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tool-cache-refresh")
+# Concurrent misses for the same call share one upstream request
+_INFLIGHT = SingleFlight()
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _tool_disk_cache():
+    """Persistent layer under _TOOL_CACHE, or None when disabled or unavailable"""
+    from config import get_shared_config
+    settings = get_shared_config().get("tool_cache", {})
+    if not settings.get("persistent"):
+        return None
+    try:
+        disk = DiskCache(settings["path"])
+        disk.purge_expired()
+        return disk
+    except Exception as e:
+        print(f"⚠️ Persistent tool cache disabled: {str(e)}")
+        return None
+
+def _persist(key, result, ttl: float, stale_ttl: float) -> None:
+    disk = _tool_disk_cache()
+    if disk is None:
+        return
+    now = time.time()
+    try:
+        disk.set(repr(key), {"value": result, "fresh_until": now + ttl, "stale_until": now + ttl + stale_ttl}, ttl + stale_ttl)
+    except Exception as e:
+        print(f"⚠️ Could not persist {key[0]} result: {str(e)}")
+
+def _load_persisted(key):
+    """
+    Promote a disk entry into _TOOL_CACHE with its remaining fresh and stale time
+
+    Returns:
+        (value, fresh) like TTLCache.get, or None
+    """
+    disk = _tool_disk_cache()
+    if disk is None:
+        return None
+    try:
+        entry = disk.get(repr(key))
+    except Exception:
+        return None
+    if entry is None:
+        return None
+    now = time.time()
+    fresh_for = max(entry["fresh_until"] - now, 0)
+    _TOOL_CACHE.set(key, entry["value"], fresh_for, max(entry["stale_until"] - now - fresh_for, 0))
+    return entry["value"], fresh_for > 0
+
+def _cacheable(result) -> bool:
+    # Tools report failures as "Error..." strings; those are never cached
+    return not (isinstance(result, str) and result.startswith("Error"))
+
+def _cached_search(ttl: float, stale_ttl: float = 0):
+    """
+    Cache a search tool's results per call arguments
+    
+    Args:
+        ttl: Seconds a result is served as fresh
+        stale_ttl: Further seconds it is served while a refresh runs in the background
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def load(key, args, kwargs):
+            result = fn(*args, **kwargs)
+            if _cacheable(result):
+                _TOOL_CACHE.set(key, result, ttl, stale_ttl)
+                _persist(key, result, ttl, stale_ttl)
+            return result
+
+        def refresh(key, args, kwargs):
+            try:
+                _INFLIGHT.do(key, load, key, args, kwargs)
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Bind defaults so f(x) and f(x, limit=5) share an entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in bound.arguments.items()
+            ))
+
+            cached = _TOOL_CACHE.get(key)
+            if cached is None:
+                cached = _load_persisted(key)
+            if cached is not None:
+                value, fresh = cached
+                if not fresh:
+                    with _refreshing_lock:
+                        start = key not in _refreshing
+                        _refreshing.add(key)
+                    if start:
+                        _REFRESH_POOL.submit(refresh, key, args, kwargs)
+                return value
+
+            return _INFLIGHT.do(key, load, key, args, kwargs)
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=4)
+def _reddit(user_agent: str = "reddit_agent") -> praw.Reddit:
+    """Shared read-only Reddit client per user agent, built on first use instead of per tool call"""
+    return praw.Reddit(
+        client_id=os.getenv("REDDIT_CLIENT_ID"),
+        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        user_agent=user_agent
+    )
 
 @tool
+@_cached_search(ttl=60, stale_ttl=240)  # Includes the live comment stream, so kept short
 def search_subreddit_content(subreddit: str, query: str, limit: int = 5, sort: str = "relevance") -> list:
     """
     Search for relevant posts and comments in a subreddit using a query string.
     Returns a list of matching posts/comments with title, author, score, and snippet.
+    'limit' applies to posts and to comments separately and is capped at 100 (one Reddit page).
     The 'sort' parameter can be 'new', 'top', or 'relevance'.
     """
-    import praw
-    import os
-    reddit = praw.Reddit(
-        client_id=os.getenv("REDDIT_CLIENT_ID"),
-        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-        user_agent="subreddit_content_search_agent"
-    )
-    results = []
+    reddit = _reddit()
+    # Reddit pages hold at most 100 items; staying within one page keeps each listing a single GET
+    page_limit = min(limit, _REDDIT_PAGE_SIZE)
+    # Fetch posts and recent comments concurrently; each listing is one network round trip
+    submissions = _REDDIT_POOL.submit(lambda: _fetch(reddit.subreddit(subreddit).search(query, sort=sort, limit=page_limit)))
+    comments = _REDDIT_POOL.submit(lambda: _fetch(reddit.subreddit(subreddit).comments(limit=page_limit)))
+    post_results = []
+    comment_results = []
     # Search posts with sort
-    for submission in reddit.subreddit(subreddit).search(query, sort=sort, limit=limit):
-        results.append({
+    for submission in submissions.result():
+        post_results.append({
             "type": "post",
             "title": submission.title,
             "author": str(submission.author),
@@ -28,37 +227,131 @@ def search_subreddit_content(subreddit: str, query: str, limit: int = 5, sort: s
             "url": submission.url,
             "snippet": submission.selftext[:200] if submission.selftext else ""
         })
-    # Search comments
-    for comment in reddit.subreddit(subreddit).comments(limit=limit):
-        if query.lower() in comment.body.lower():
-            results.append({
+    # Search comments; the case-insensitive regex scans each body without building a lowered copy
+    query_pattern = re.compile(re.escape(query), re.IGNORECASE)
+    for comment in comments.result():
+        if query_pattern.search(comment.body):
+            comment_results.append({
                 "type": "comment",
                 "author": str(comment.author),
                 "score": comment.score,
                 "snippet": comment.body[:200],
                 "link": f"https://reddit.com{comment.permalink}"
             })
-    # Sort comments by score (top first)
-    comment_results = [r for r in results if r["type"] == "comment"]
-    post_results = [r for r in results if r["type"] == "post"]
-    comment_results.sort(key=lambda x: x["score"], reverse=True)
+    # Top comments by score (top first); a bounded heap instead of sorting every match
+    comment_results = heapq.nlargest(limit, comment_results, key=operator.itemgetter("score"))
     # Combine posts and sorted comments
     return post_results + comment_results
 
 
 @tool
+@_cached_search(ttl=300, stale_ttl=900)
+def search_subreddits_content(subreddits: list[str], query: str, limit: int = 5, sort: str = "relevance") -> dict:
+    """
+    Search several subreddits for posts matching a query in a single request.
+    Prefer this over calling search_subreddit_content once per subreddit.
+    Returns a dict mapping each subreddit name to its top posts (by score), up to 'limit' per subreddit.
+    Counts are best-effort: all subreddits share one page of 100 results, so a very active one can crowd out the rest.
+    The 'sort' parameter can be 'new', 'top', or 'relevance'.
+    """
+    if not subreddits:
+        return {}
+    reddit = _reddit()
+    results = {name: [] for name in subreddits}
+    by_lower = {name.lower(): name for name in subreddits}
+    # r/sub1+sub2+... searches all of them at once. The page is ranked across subreddits, so the
+    # whole page (same single GET) is taken to leave quieter subreddits room before the per-subreddit cut
+    for submission in _fetch(reddit.subreddit("+".join(subreddits)).search(query, sort=sort, limit=_REDDIT_PAGE_SIZE)):
+        name = by_lower.get(submission.subreddit.display_name.lower(), submission.subreddit.display_name)
+        results.setdefault(name, []).append({
+            "type": "post",
+            "title": submission.title,
+            "author": str(submission.author),
+            "score": submission.score,
+            "url": submission.url,
+            "snippet": submission.selftext[:200] if submission.selftext else ""
+        })
+    # The shared request ranks across subreddits, so the per-subreddit cut is made here
+    for name, posts in results.items():
+        results[name] = heapq.nlargest(limit, posts, key=operator.itemgetter("score"))
+    return results
+
+_ARCHIVE_SEARCH_URL = "https://api.pullpush.io/reddit/search/submission/"
+
+def _archive_epoch(date: str) -> int:
+    """YYYY-MM-DD (UTC midnight) to a Unix timestamp"""
+    return int(datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+
+@tool
+@_cached_search(ttl=3600, stale_ttl=86400)  # Archived posts are settled; only their live scores move
+def search_subreddit_content_archive(subreddit: str, query: str, after: str, before: str, limit: int = 10, sort: str = "top") -> list:
+    """
+    Search a subreddit's older posts between two dates (YYYY-MM-DD, before is exclusive).
+    Use this instead of search_subreddit_content for anything older than a few weeks or for a specific period.
+    Returns a list of posts with title, author, score, url, snippet, and date.
+    'limit' is capped at 100; narrow the date range to see more posts from a busy period.
+    The 'sort' parameter can be 'top' or 'new'.
+    """
+    # requests ships with praw; imported here so only this tool needs the archive
+    import requests
+    from config import get_shared_config
+
+    size = min(limit, _REDDIT_PAGE_SIZE)
+    try:
+        response = requests.get(_ARCHIVE_SEARCH_URL, params={
+            "subreddit": subreddit,
+            "q": query,
+            "after": _archive_epoch(after),
+            "before": _archive_epoch(before),
+            "sort_type": "created_utc" if sort == "new" else "score",
+            "sort": "desc",
+            "size": size,
+        }, timeout=get_shared_config()["default_timeouts"]["api_timeout"])
+        response.raise_for_status()
+        # Records without an id can't be linked to live scores and are dropped
+        archived = [post for post in response.json().get("data", [])[:size] if post.get("id")]
+    except Exception as e:
+        return f"Error searching the Reddit archive: {str(e)}"
+
+    # The whole date window comes back in one archive call; a single info() request then
+    # refreshes the scores for up to 100 posts, since archived scores are ingest-time snapshots
+    live_scores = {}
+    if archived:
+        try:
+            live_scores = {
+                submission.id: submission.score
+                for submission in _fetch(_reddit().info(fullnames=[f"t3_{post['id']}" for post in archived]))
+            }
+        except Exception:
+            pass
+
+    results = []
+    for post in archived:
+        selftext = post.get("selftext") or ""
+        results.append({
+            "type": "post",
+            "title": post.get("title", ""),
+            "author": post.get("author", ""),
+            "score": live_scores.get(post["id"], post.get("score", 0)),
+            "url": post.get("url") or f"https://reddit.com{post.get('permalink', '')}",
+            "snippet": selftext[:200],
+            "date": datetime.fromtimestamp(post.get("created_utc", 0), timezone.utc).strftime("%Y-%m-%d")
+        })
+    if sort != "new":
+        results.sort(key=operator.itemgetter("score"), reverse=True)
+    return results
+
+@tool
+@_cached_search(ttl=3600, stale_ttl=86400)  # Subreddit listings rarely change
 def search_subreddits(query: str, limit: int = 5) -> list:
     """
     Search for relevant subreddits using a query string.
     Returns a list of subreddit names and their descriptions.
+    'limit' is capped at 100.
     """
-    reddit = praw.Reddit(
-        client_id=os.getenv("REDDIT_CLIENT_ID"),
-        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-        user_agent="subreddit_search_agent"
-    )
+    reddit = _reddit()
     results = []
-    for subreddit in reddit.subreddits.search(query, limit=limit):
+    for subreddit in _fetch(reddit.subreddits.search(query, limit=min(limit, _REDDIT_PAGE_SIZE))):
         results.append({
             "name": subreddit.display_name,
             "title": subreddit.title,
@@ -66,12 +359,24 @@ def search_subreddits(query: str, limit: int = 5) -> list:
         })
     return results
 
+@functools.lru_cache(maxsize=1)
+def _grounding_ctx(api_key: str):
+    """Gemini client and Google Search grounding config, built once per API key"""
+    # Imported here so a missing google-genai only affects this tool
+    from google import genai
+    from google.genai import types
+
+    client = genai.Client(api_key=api_key)
+    config = types.GenerateContentConfig(tools=[types.Tool(google_search=types.GoogleSearch())])
+    return client, config
+
 @tool
 def get_current_date() -> str:
     """Returns the current date in ISO format."""
-    return datetime.utcnow().isoformat()
+    return datetime.now(timezone.utc).isoformat()
 
 @tool
+@_cached_search(ttl=300, stale_ttl=900)
 def google_grounding_search(query: str) -> str:
     """
     Search for current information using Google's grounded search.
@@ -94,24 +399,13 @@ def google_grounding_search(query: str) -> str:
     - google_grounding_search("Manchester United new signings 2025")
     """
     try:
-        # Import the newer Google genai library
-        from google import genai
-        from google.genai import types
-        import os
-        
         # Get API key from environment
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             return "Error: GEMINI_API_KEY not found in environment variables"
         
-        # Initialize client and grounding tool
-        client = genai.Client(api_key=api_key)
-        grounding_tool = types.Tool(google_search=types.GoogleSearch())
-        
-        # Configure for grounding
-        grounding_config = types.GenerateContentConfig(
-            tools=[grounding_tool]
-        )
+        # Shared client and grounding config
+        client, grounding_config = _grounding_ctx(api_key)
         
         #print(f"🔎 Performing grounded search for: {query}")
         
@@ -151,14 +445,14 @@ def research_topic_for_content(topic: str, platform_focus: str = "both") -> str:
         # Import here to avoid circular imports
         from reddit_agent import RedditAgent
         from config import get_tool_prompt
-        from datetime import datetime
+        from datetime import datetime, timezone
         
         # Get research prompt from config
         research_prompt = get_tool_prompt(
             "research_prompt", 
             topic=topic, 
             platform_focus=platform_focus,
-            current_date=datetime.utcnow().isoformat()
+            current_date=datetime.now(timezone.utc).isoformat()
         )
         
         # Create research agent instance
@@ -186,12 +480,12 @@ def research_trending_topics(category: str = "general") -> str:
     try:
         from reddit_agent import RedditAgent
         from config import get_tool_prompt
-        from datetime import datetime
+        from datetime import datetime, timezone
         
         trending_prompt = get_tool_prompt(
             "trending_research_prompt", 
             category=category,
-            current_date=datetime.utcnow().isoformat()
+            current_date=datetime.now(timezone.utc).isoformat()
         )
         
         research_agent = RedditAgent()
@@ -203,6 +497,174 @@ def research_trending_topics(category: str = "general") -> str:
     except Exception as e:
         return f"Error during trending research: {str(e)}"
 
+# Generation prompts specialized per (platform, content type, tone): everything but the
+# topic and research is filled in once, then reused (see config.get_specialized_prompt).
+def video_prompt(platform: str, content_type: str, tone: str):
+    """Specialized content_generation_prompt for a YouTube/TikTok script"""
+    from config import get_content_creator_config, get_specialized_prompt
+
+    config = get_content_creator_config()
+    platform_specs = config["platform_specs"]
+    specs = platform_specs.get(platform.lower(), platform_specs["youtube"])
+    content_type_details = config["content_types"].get(content_type, {})
+
+    return get_specialized_prompt(
+        "content_generation_prompt",
+        platform=platform.upper(),
+        content_description=content_type_details.get("description", ""),
+        content_structure=content_type_details.get("structure", ""),
+        tone_description=config["tone_settings"].get(tone, ""),
+        duration=specs.get("optimal_duration", "30-60s"),
+        hook_time=specs["hook_time"],
+        pace=specs["pace"],
+        style=specs["style"]
+    )
+
+def article_prompt(tone: str, style: str, optimal_length: str):
+    """Specialized article_generation_prompt"""
+    from config import get_content_creator_config, get_specialized_prompt
+
+    return get_specialized_prompt(
+        "article_generation_prompt",
+        tone_description=get_content_creator_config()["tone_settings"].get(tone, ""),
+        style=style,
+        optimal_length=optimal_length
+    )
+
+def x_thread_prompt(tone: str, style: str, thread_length: str):
+    """Specialized x_thread_generation_prompt"""
+    from config import get_content_creator_config, get_specialized_prompt
+
+    return get_specialized_prompt(
+        "x_thread_generation_prompt",
+        tone_description=get_content_creator_config()["tone_settings"].get(tone, ""),
+        style=style,
+        thread_length=thread_length
+    )
+
+def bundle_prompt(tone: str, style: str, optimal_length: str, thread_length: str):
+    """Specialized content_bundle_prompt"""
+    from config import get_content_creator_config, get_specialized_prompt
+
+    return get_specialized_prompt(
+        "content_bundle_prompt",
+        tone_description=get_content_creator_config()["tone_settings"].get(tone, ""),
+        style=style,
+        optimal_length=optimal_length,
+        thread_length=thread_length
+    )
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model: str, temperature: float):
+    """Shared chat model client, so each generation call reuses its connection"""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        api_key=os.getenv("GEMINI_API_KEY")
+    )
+
+def _content_llm():
+    """Chat model for the generation tools, from the content creator model config"""
+    from config import get_content_creator_config
+
+    model_config = get_content_creator_config()["model"]
+    return _get_llm(model_config["name"], model_config["temperature"])
+
+def _add_async(generation_tool, build_prompt, error_label: str, parse=None, on_error=None):
+    """
+    Give a generation tool a native coroutine so ainvoke awaits llm.ainvoke
+    instead of occupying an executor thread; callers can gather several at once
+    
+    Args:
+        generation_tool: The @tool whose sync body also uses build_prompt
+        build_prompt: Builds the prompt from the tool's arguments
+        error_label: Used in the returned error message, as in the sync tool
+        parse: Turns the response text into the tool's result, if it is not the text itself
+        on_error: Builds the result for a failure from its message, if it is not the message itself
+    """
+    async def run(**kwargs):
+        try:
+            response = await _content_llm().ainvoke(build_prompt(**kwargs))
+            return parse(response.content) if parse else response.content
+        except Exception as e:
+            message = f"Error {error_label}: {str(e)}"
+            return on_error(message) if on_error else message
+
+    generation_tool.coroutine = run
+    return generation_tool
+
+def _platform_content_prompt(topic, platform, research_summary, content_type="educational", tone="engaging") -> str:
+    from config import render_prompt
+
+    return render_prompt(
+        "content_generation_prompt",
+        video_prompt(platform, content_type, tone),
+        topic=topic,
+        research_summary=research_summary
+    )
+
+def _analysis_prompt(content_text, platform) -> str:
+    from config import get_tool_prompt
+
+    return get_tool_prompt(
+        "content_analysis_prompt",
+        content_text=content_text,
+        platform=platform,
+        current_date=datetime.now(timezone.utc).isoformat()
+    )
+
+def _article_prompt(topic, research_summary, tone, style, optimal_length) -> str:
+    from config import render_prompt
+
+    return render_prompt(
+        "article_generation_prompt",
+        article_prompt(tone, style, optimal_length),
+        topic=topic,
+        research_summary=research_summary
+    )
+
+def _x_thread_prompt(topic, research_summary, tone, style, thread_length) -> str:
+    from config import render_prompt
+
+    return render_prompt(
+        "x_thread_generation_prompt",
+        x_thread_prompt(tone, style, thread_length),
+        topic=topic,
+        research_summary=research_summary
+    )
+
+def _bundle_prompt(topic, research_summary, tone, style, optimal_length, thread_length) -> str:
+    from config import render_prompt
+
+    return render_prompt(
+        "content_bundle_prompt",
+        bundle_prompt(tone, style, optimal_length, thread_length),
+        topic=topic,
+        research_summary=research_summary,
+        current_date=datetime.now(timezone.utc).isoformat()
+    )
+
+# Section markers content_bundle_prompt asks for, in order, and the result key for each
+_BUNDLE_SECTIONS = {"=== ARTICLE ===": "article", "=== X THREAD ===": "x_thread", "=== ANALYSIS ===": "analysis"}
+_BUNDLE_MARKER = re.compile("^(" + "|".join(map(re.escape, _BUNDLE_SECTIONS)) + ")[ \t]*$", re.MULTILINE)
+
+def _bundle_error(message: str) -> dict:
+    """Failure result for generate_content_bundle, keeping its dict shape"""
+    return {**dict.fromkeys(_BUNDLE_SECTIONS.values(), ""), "error": message}
+
+def _parse_bundle(text: str) -> dict:
+    """Split a content_bundle_prompt response into its sections; missing sections come back empty"""
+    bundle = dict.fromkeys(_BUNDLE_SECTIONS.values(), "")
+    markers = list(_BUNDLE_MARKER.finditer(text))
+    if not markers:
+        raise ValueError("response has no section markers")
+    for marker, following in zip(markers, markers[1:] + [None]):
+        end = following.start() if following else len(text)
+        bundle[_BUNDLE_SECTIONS[marker.group(1)]] = text[marker.end():end].strip()
+    return bundle
+
 @tool
 def generate_platform_content(
     topic: str,
@@ -226,47 +688,8 @@ def generate_platform_content(
     """
     
     try:
-        from config import get_content_creator_config, get_tool_prompt
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        import os
-
-        config = get_content_creator_config()
-        platform_specs = config["platform_specs"]
-        content_types = config["content_types"]
-        tone_settings = config["tone_settings"]
-        
-        specs = platform_specs.get(platform.lower(), platform_specs["youtube"])
-        
-        content_type_details = content_types.get(content_type, {})
-        content_description = content_type_details.get("description", "")
-        content_structure = content_type_details.get("structure", "")
-
-        tone_description = tone_settings.get(tone, "")
-
-        duration = specs.get("optimal_duration", "30-60s")
-
-        content_prompt = get_tool_prompt(
-            "content_generation_prompt",
-            topic=topic,
-            platform=platform.upper(),
-            research_summary=research_summary,
-            content_description=content_description,
-            content_structure=content_structure,
-            tone_description=tone_description,
-            duration=duration,
-            hook_time=specs["hook_time"],
-            pace=specs["pace"],
-            style=specs["style"]
-        )
-        
-        model_config = config["model"]
-        llm = ChatGoogleGenerativeAI(
-            model=model_config["name"],
-            temperature=model_config["temperature"],
-            api_key=os.getenv("GEMINI_API_KEY")
-        )
-
-        response = llm.invoke(content_prompt)
+        content_prompt = _platform_content_prompt(topic, platform, research_summary, content_type, tone)
+        response = _content_llm().invoke(content_prompt)
         return response.content
         
     except Exception as e:
@@ -286,29 +709,8 @@ def analyze_content_performance(content_text: str, platform: str) -> str:
     """
     
     try:
-        from config import get_tool_prompt, get_content_creator_config
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        import os
-
-        current_date = datetime.utcnow().isoformat()
-
-        analysis_prompt = get_tool_prompt(
-            "content_analysis_prompt",
-            content_text=content_text,
-            platform=platform,
-            current_date=current_date
-        )
-        
-        config = get_content_creator_config()
-        model_config = config["model"]
-        
-        llm = ChatGoogleGenerativeAI(
-            model=model_config["name"],
-            temperature=model_config["temperature"],
-            api_key=os.getenv("GEMINI_API_KEY")
-        )
-        
-        response = llm.invoke(analysis_prompt)
+        analysis_prompt = _analysis_prompt(content_text, platform)
+        response = _content_llm().invoke(analysis_prompt)
         return response.content
         
     except Exception as e:
@@ -330,32 +732,8 @@ def generate_article(topic: str, research_summary: str, tone: str, style: str, o
         The generated article as a string.
     """
     try:
-        from config import get_content_creator_config, get_tool_prompt
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        import os
-
-        config = get_content_creator_config()
-        tone_settings = config["tone_settings"]
-        
-        tone_description = tone_settings.get(tone, "")
-
-        prompt = get_tool_prompt(
-            "article_generation_prompt",
-            topic=topic,
-            research_summary=research_summary,
-            tone_description=tone_description,
-            style=style,
-            optimal_length=optimal_length
-        )
-        
-        model_config = config["model"]
-        llm = ChatGoogleGenerativeAI(
-            model=model_config["name"],
-            temperature=model_config["temperature"],
-            api_key=os.getenv("GEMINI_API_KEY")
-        )
-
-        response = llm.invoke(prompt)
+        prompt = _article_prompt(topic, research_summary, tone, style, optimal_length)
+        response = _content_llm().invoke(prompt)
         return response.content
         
     except Exception as e:
@@ -377,37 +755,59 @@ def generate_x_thread(topic: str, research_summary: str, tone: str, style: str,
         The generated thread as a single string, with posts separated by '---'.
     """
     try:
-        from config import get_content_creator_config, get_tool_prompt
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        import os
-
-        config = get_content_creator_config()
-        tone_settings = config["tone_settings"]
-        
-        tone_description = tone_settings.get(tone, "")
-
-        prompt = get_tool_prompt(
-            "x_thread_generation_prompt",
-            topic=topic,
-            research_summary=research_summary,
-            tone_description=tone_description,
-            style=style,
-            thread_length=thread_length
-        )
-        
-        model_config = config["model"]
-        llm = ChatGoogleGenerativeAI(
-            model=model_config["name"],
-            temperature=model_config["temperature"],
-            api_key=os.getenv("GEMINI_API_KEY")
-        )
-
-        response = llm.invoke(prompt)
+        prompt = _x_thread_prompt(topic, research_summary, tone, style, thread_length)
+        response = _content_llm().invoke(prompt)
         return response.content
         
     except Exception as e:
         return f"Error generating X thread: {str(e)}"
 
+# For the tool-calling agent only: create_content keeps separate per-platform calls, which run
+# concurrently, while a bundle decodes its three sections one after another in a single response
+@tool
+def generate_content_bundle(
+    topic: str,
+    research_summary: str,
+    tone: str,
+    style: str,
+    optimal_length: str,
+    thread_length: str
+) -> dict:
+    """
+    Generates an article, an X thread, and an analysis of the article in one model call.
+    Prefer this over calling generate_article, generate_x_thread, and analyze_content_performance
+    separately when all three are needed for the same research.
+    
+    Args:
+        topic: The main subject of the content.
+        research_summary: A summary of research findings for context.
+        tone: "conversational", "authoritative", "energetic", "inspirational", "humorous", "intriguing", "suspenseful".
+        style: The desired writing style.
+        optimal_length: The target length for the article.
+        thread_length: The target number of posts in the thread.
+        
+    Returns:
+        A dict with "article", "x_thread" (posts separated by '---'), and "analysis";
+        on failure the sections are empty and "error" holds the message.
+    """
+    try:
+        prompt = _bundle_prompt(topic, research_summary, tone, style, optimal_length, thread_length)
+        response = _content_llm().invoke(prompt)
+        return _parse_bundle(response.content)
+        
+    except Exception as e:
+        return _bundle_error(f"Error generating content bundle: {str(e)}")
+
+_add_async(generate_platform_content, _platform_content_prompt, "generating content")
+_add_async(analyze_content_performance, _analysis_prompt, "during content analysis")
+_add_async(generate_article, _article_prompt, "generating article")
+_add_async(generate_x_thread, _x_thread_prompt, "generating X thread")
+_add_async(generate_content_bundle, _bundle_prompt, "generating content bundle", parse=_parse_bundle, on_error=_bundle_error)
+
+# Filename sanitizing for save_content_to_file
+_FILENAME_UNSAFE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATORS = re.compile(r'[-\s]+')
+
 @tool
 def save_content_to_file(content: str, folder: str, topic: str, platform: str) -> str:
     """
@@ -423,20 +823,16 @@ def save_content_to_file(content: str, folder: str, topic: str, platform: str) -
         The path to the saved file or an error message.
     """
     try:
-        import os
-        import re
-        from datetime import datetime
-
         # Create the folder if it doesn't exist
         os.makedirs(folder, exist_ok=True)
         
         # Sanitize the topic to create a valid filename
         # Remove special characters, replace spaces with underscores
-        sanitized_topic = re.sub(r'[^\w\s-]', '', topic).strip().replace(' ', '_')
-        sanitized_topic = re.sub(r'[-\s]+', '_', sanitized_topic).lower()
+        sanitized_topic = _FILENAME_UNSAFE.sub('', topic).strip().replace(' ', '_')
+        sanitized_topic = _FILENAME_SEPARATORS.sub('_', sanitized_topic).lower()
 
         # Create a timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # Determine file extension
         ext = ".txt"